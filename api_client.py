@@ -0,0 +1,152 @@
+"""
+Shared API client for the Workforce Distribution.ai scripts and frontend
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+
+API_BASE_URL = os.getenv("API_BASE_URL", "http://localhost:8000/api/v1")
+
+# Seconds a GET response is served from the cache before it is revalidated
+DEFAULT_TTL = float(os.getenv("API_CACHE_TTL", "30"))
+
+# Cached GET responses kept per client; the least recently used are evicted
+CACHE_SIZE = int(os.getenv("API_CACHE_SIZE", "256"))
+
+POOL_SIZE = 10
+
+# Requests carrying credentials are never cached, so a response fetched for
+# one user is never served to another
+CREDENTIAL_HEADERS = ("authorization", "cookie", "proxy-authorization")
+
+class APIClient:
+    """Pooled HTTP session with a TTL response cache and ETag revalidation
+
+    GET responses are cached by URL, query string included, and per-call
+    headers; requests with credentials (on the call or the session) bypass
+    the cache. A fresh entry is returned without any request. A stale entry
+    that carried an ETag is revalidated with If-None-Match, and a 304 reuses
+    the cached body; stale entries without an ETag are dropped. Any write
+    (POST/PUT/PATCH/DELETE) clears the cache, since it can change any listing
+    or statistic, and a GET that was in flight during the write is not
+    cached. At most cache_size entries are kept, evicting the least recently
+    used.
+    """
+
+    def __init__(self, base_url=API_BASE_URL, pool_size=POOL_SIZE, default_ttl=DEFAULT_TTL,
+                 cache_size=CACHE_SIZE):
+        self.base_url = base_url
+        self.default_ttl = default_ttl
+        self.pool_size = pool_size
+        self.cache_size = cache_size
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        # Bumped by invalidate(), so a GET that raced a write is not cached
+        self._generation = 0
+        self.stats = {"hits": 0, "revalidated": 0, "misses": 0, "evicted": 0}
+
+    def _url(self, path):
+        return f"{self.base_url}{path}"
+
+    def _key(self, path, params, headers):
+        """The URL requests would send, so list values and every params form work,
+        plus the per-call headers"""
+        if isinstance(params, dict):
+            params = sorted(params.items())
+        prepared = requests.PreparedRequest()
+        prepared.prepare_url(self._url(path), params)
+        return prepared.url, tuple(sorted((name.lower(), value) for name, value in headers.items()))
+
+    def _has_credentials(self, headers):
+        """Whether the call or the session would send credentials"""
+        names = {name.lower() for name in list(headers) + list(self.session.headers)}
+        return bool(self.session.cookies) or any(name in names for name in CREDENTIAL_HEADERS)
+
+    def get(self, path, params=None, ttl=None, **kwargs):
+        """GET path, served from the cache while fresh; ttl=0 bypasses the cache"""
+        ttl = self.default_ttl if ttl is None else ttl
+        headers = dict(kwargs.pop("headers", None) or {})
+        if ttl <= 0 or self._has_credentials(headers):
+            return self.session.get(self._url(path), params=params, headers=headers, **kwargs)
+
+        key = self._key(path, params, headers)
+        with self._lock:
+            generation = self._generation
+            entry = self._cache.get(key)
+            if entry and time.monotonic() - entry["fetched_at"] < ttl:
+                self._cache.move_to_end(key)
+                self.stats["hits"] += 1
+                return entry["response"]
+            if entry and not entry["etag"]:
+                # Expired and nothing to revalidate with
+                del self._cache[key]
+                entry = None
+
+        if entry and entry["etag"]:
+            headers["If-None-Match"] = entry["etag"]
+        response = self.session.get(self._url(path), params=params, headers=headers, **kwargs)
+
+        with self._lock:
+            if response.status_code == 304 and entry:
+                entry["fetched_at"] = time.monotonic()
+                if key in self._cache:
+                    self._cache.move_to_end(key)
+                self.stats["revalidated"] += 1
+                return entry["response"]
+            self.stats["misses"] += 1
+            if response.status_code == 200 and generation == self._generation:
+                self._cache[key] = {
+                    "response": response,
+                    "etag": response.headers.get("ETag"),
+                    "fetched_at": time.monotonic()
+                }
+                self._cache.move_to_end(key)
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+                    self.stats["evicted"] += 1
+        return response
+
+    def get_many(self, calls, ttl=None):
+        """Fetch several GETs in parallel; calls are paths or (path, params) tuples"""
+        calls = [(call, None) if isinstance(call, str) else call for call in calls]
+        with ThreadPoolExecutor(max_workers=min(len(calls), self.pool_size) or 1) as pool:
+            return list(pool.map(lambda call: self.get(call[0], call[1], ttl=ttl), calls))
+
+    def request(self, method, path, **kwargs):
+        """Send a write request and invalidate the cache"""
+        try:
+            return self.session.request(method, self._url(path), **kwargs)
+        finally:
+            self.invalidate()
+
+    def post(self, path, **kwargs):
+        return self.request("POST", path, **kwargs)
+
+    def put(self, path, **kwargs):
+        return self.request("PUT", path, **kwargs)
+
+    def patch(self, path, **kwargs):
+        return self.request("PATCH", path, **kwargs)
+
+    def delete(self, path, **kwargs):
+        return self.request("DELETE", path, **kwargs)
+
+    def invalidate(self):
+        """Drop every cached response"""
+        with self._lock:
+            self._cache.clear()
+            self._generation += 1
+
+# Shared instance: module state survives Streamlit reruns, so the pool and
+# cache are reused across widget interactions as well as within a script
+client = APIClient()
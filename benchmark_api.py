@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+"""
+Benchmark harness and synthetic data generator for the Workforce Distribution.ai API
+"""
+
+import argparse
+import csv
+import json
+import os
+import random
+import subprocess
+import time
+from datetime import datetime, timezone
+
+import requests
+
+API_BASE_URL = os.getenv("API_BASE_URL", "http://localhost:8000/api/v1")
+CSV_FILE_PATH = "WA_Fn-UseC_-HR-Employee-Attrition.csv"
+DATA_DIR = "benchmark_data"
+RESULTS_DIR = "benchmark_results"
+
+SIZES = {"10k": 10_000, "100k": 100_000, "1m": 1_000_000}
+
+# Generated extracts are split into parts so each import request stays bounded
+PART_ROWS = 50_000
+
+# Numeric columns that get multiplicative noise so resampled rows are not exact copies
+NOISY_COLUMNS = {"MonthlyIncome": 0.10, "DailyRate": 0.10, "HourlyRate": 0.10, "MonthlyRate": 0.10}
+
+# (method, path, JSON body) for each endpoint the harness drives
+ENDPOINTS = [
+    ("GET", "/jobs/", None),
+    ("GET", "/candidates/", None),
+    ("POST", "/analysis/distribute", {}),
+    ("POST", "/analysis/skills-gaps", {}),
+    ("GET", "/analysis/salary-benchmark", None),
+    ("GET", "/analysis/dashboard/stats", None)
+]
+
+# Vocabulary and value ranges taken from sample_data.py
+SAMPLE_SKILLS = [
+    "Python", "JavaScript", "SQL", "System Design", "React", "Docker", "AWS", "Leadership",
+    "Machine Learning", "Statistics", "TensorFlow", "PyTorch", "Data Visualization", "Research",
+    "Product Strategy", "User Research", "Agile", "Analytics", "A/B Testing", "Big Data"
+]
+SAMPLE_DEPARTMENTS = ["Engineering", "Data Science", "Product"]
+SAMPLE_LEVELS = ["Junior", "Mid", "Senior"]
+SAMPLE_EDUCATION = ["Bachelor", "Master", "MBA", "PhD"]
+SAMPLE_LOCATIONS = ["San Francisco, CA", "New York, NY", "Austin, TX", "Seattle, WA", "Boston, MA", "Remote"]
+
+def load_attrition_rows(csv_path=CSV_FILE_PATH):
+    """Read the real attrition extract that synthetic rows are resampled from"""
+    with open(csv_path, newline='', encoding='utf-8-sig') as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        return header, list(reader)
+
+def generate_attrition_csv(rows, out_dir, seed=0, csv_path=CSV_FILE_PATH):
+    """Write a synthetic extract shaped like the attrition CSV, split into parts
+
+    Rows are bootstrap-resampled from the real file, so the joint distribution
+    of role, department, level, satisfaction and attrition is preserved. Pay
+    columns get a little noise, and EmployeeNumber is made unique.
+    """
+    rng = random.Random(seed)
+    header, source = load_attrition_rows(csv_path)
+    employee_number = header.index("EmployeeNumber")
+    noisy = {header.index(column): spread for column, spread in NOISY_COLUMNS.items()}
+
+    os.makedirs(out_dir, exist_ok=True)
+    paths = []
+    for part_start in range(0, rows, PART_ROWS):
+        path = os.path.join(out_dir, f"attrition_part_{part_start // PART_ROWS:04d}.csv")
+        with open(path, "w", newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(header)
+            for number in range(part_start + 1, min(part_start + PART_ROWS, rows) + 1):
+                row = list(rng.choice(source))
+                row[employee_number] = str(number)
+                for index, spread in noisy.items():
+                    row[index] = str(max(1, round(int(row[index]) * rng.uniform(1 - spread, 1 + spread))))
+                writer.writerow(row)
+        paths.append(path)
+    return paths
+
+def generate_candidates(count, seed=0):
+    """Synthetic candidates in the schema used by sample_data.py"""
+    rng = random.Random(seed)
+    for number in range(1, count + 1):
+        years = round(rng.uniform(0, 20), 1)
+        yield {
+            "first_name": f"Bench{number}",
+            "last_name": "Candidate",
+            "email": f"bench.candidate{number}@example.com",
+            "phone": f"+1-555-{number % 10000:04d}",
+            "current_position": rng.choice(["Software Engineer", "Data Analyst", "Product Manager"]),
+            "current_company": "Bench Corp",
+            "years_experience": years,
+            "education_level": rng.choice(SAMPLE_EDUCATION),
+            "skills": {skill: rng.randint(3, 10) for skill in rng.sample(SAMPLE_SKILLS, rng.randint(4, 8))},
+            "expected_salary": round(60000 + years * 6000 * rng.uniform(0.8, 1.2), -3),
+            "salary_currency": "USD",
+            "preferred_locations": rng.sample(SAMPLE_LOCATIONS, 2),
+            "preferred_work_type": "Full-time",
+            "preferred_departments": [rng.choice(SAMPLE_DEPARTMENTS)],
+            "is_available": rng.random() < 0.85
+        }
+
+def generate_jobs(count, seed=0):
+    """Synthetic jobs in the schema used by sample_data.py"""
+    rng = random.Random(seed)
+    for number in range(1, count + 1):
+        level = rng.choice(SAMPLE_LEVELS)
+        base = {"Junior": 70000, "Mid": 100000, "Senior": 130000}[level]
+        skills = rng.sample(SAMPLE_SKILLS, 7)
+        yield {
+            "title": f"Bench Role {number}",
+            "department": rng.choice(SAMPLE_DEPARTMENTS),
+            "level": level,
+            "min_salary": base,
+            "max_salary": base + 50000,
+            "currency": "USD",
+            "required_skills": skills[:4],
+            "preferred_skills": skills[4:],
+            "experience_years": {"Junior": 1, "Mid": 3, "Senior": 5}[level],
+            "education_level": rng.choice(SAMPLE_EDUCATION),
+            "description": "Synthetic benchmark role",
+            "responsibilities": ["Deliver benchmark work"],
+            "benefits": ["Health insurance"],
+            "location": rng.choice(SAMPLE_LOCATIONS),
+            "work_type": "Full-time"
+        }
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return None
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * fraction))]
+
+def summarize(latencies, errors, elapsed):
+    """Latency percentiles (ms), throughput and error count for one scenario"""
+    latencies = sorted(latencies)
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "p50_ms": round(percentile(latencies, 0.50) * 1000, 2) if latencies else None,
+        "p95_ms": round(percentile(latencies, 0.95) * 1000, 2) if latencies else None,
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 2) if latencies else None,
+        "throughput_rps": round(len(latencies) / elapsed, 2) if elapsed else None
+    }
+
+def bench_import(paths):
+    """Import the generated parts and measure rows/sec"""
+    latencies, errors, rows = [], 0, 0
+    started = time.perf_counter()
+    for path in paths:
+        part_started = time.perf_counter()
+        response = requests.post(f"{API_BASE_URL}/data-import/csv/import-from-path",
+                                 params={"file_path": os.path.abspath(path)})
+        latencies.append(time.perf_counter() - part_started)
+        if response.status_code == 200:
+            rows += response.json().get("total_records", 0)
+        else:
+            errors += 1
+    elapsed = time.perf_counter() - started
+    result = summarize(latencies, errors, elapsed)
+    result["rows"] = rows
+    result["rows_per_second"] = round(rows / elapsed, 1) if elapsed else None
+    return result
+
+def bench_replay(resource, ndjson_path):
+    """Replay an NDJSON file through POST /{resource}/, one record per request"""
+    session = requests.Session()
+    latencies, errors = [], 0
+    started = time.perf_counter()
+    with open(ndjson_path) as f:
+        for line in f:
+            call_started = time.perf_counter()
+            response = session.post(f"{API_BASE_URL}/{resource}/", json=json.loads(line))
+            latencies.append(time.perf_counter() - call_started)
+            if response.status_code != 200:
+                errors += 1
+    elapsed = time.perf_counter() - started
+    result = summarize(latencies, errors, elapsed)
+    result["records_created"] = len(latencies) - errors
+    result["records_per_second"] = round((len(latencies) - errors) / elapsed, 1) if elapsed else None
+    return result
+
+def bench_endpoint(method, path, body, repeat):
+    """Call one endpoint repeatedly and summarize its latency"""
+    session = requests.Session()
+    latencies, errors, statuses = [], 0, {}
+    started = time.perf_counter()
+    for _ in range(repeat):
+        call_started = time.perf_counter()
+        response = session.request(method, f"{API_BASE_URL}{path}", json=body)
+        latencies.append(time.perf_counter() - call_started)
+        statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+        if response.status_code != 200:
+            errors += 1
+    result = summarize(latencies, errors, time.perf_counter() - started)
+    result["status_codes"] = statuses
+    return result
+
+def peak_rss_mb(pid=None):
+    """Peak resident set size in MB of a process (the backend if its pid is given)"""
+    if pid:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return round(int(line.split()[1]) / 1024, 1)
+        return None
+    try:
+        import resource
+    except ImportError:
+        # Not available on Windows
+        return None
+    # ru_maxrss is KiB on Linux
+    return round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+
+def current_commit():
+    """Short hash of the checked-out commit, so runs can be compared across commits"""
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"],
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+def run(size, repeat, server_pid=None, skip_import=False, seed=0):
+    """Generate (or reuse) a dataset, import it and drive every endpoint"""
+    rows = SIZES[size]
+    data_dir = os.path.join(DATA_DIR, size)
+    paths = sorted(os.path.join(data_dir, name) for name in os.listdir(data_dir) if name.endswith(".csv")) \
+        if os.path.isdir(data_dir) else []
+    if not paths:
+        print(f"📦 Generating {rows:,} synthetic employees in {data_dir}...")
+        paths = generate_attrition_csv(rows, data_dir, seed)
+
+    results = {
+        "commit": current_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "dataset": size,
+        "rows": rows,
+        "scenarios": {}
+    }
+
+    if not skip_import:
+        print(f"🚀 Importing {len(paths)} parts...")
+        results["scenarios"]["csv_import"] = bench_import(paths)
+        # Jobs before candidates, as sample_data.py creates them
+        for resource in ("jobs", "candidates"):
+            ndjson_path = os.path.join(data_dir, f"{resource}.ndjson")
+            if os.path.exists(ndjson_path):
+                print(f"🚀 Creating {resource} from {ndjson_path}...")
+                results["scenarios"][f"POST /{resource}/"] = bench_replay(resource, ndjson_path)
+
+    for method, path, body in ENDPOINTS:
+        print(f"⏱️  {method} {path} x{repeat}...")
+        results["scenarios"][f"{method} {path}"] = bench_endpoint(method, path, body, repeat)
+
+    results["peak_rss_mb"] = {"harness": peak_rss_mb(), "server": peak_rss_mb(server_pid) if server_pid else None}
+
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    out_path = os.path.join(RESULTS_DIR, f"{size}_{results['commit']}_{int(time.time())}.json")
+    with open(out_path, "w") as f:
+        json.dump(results, f, indent=2)
+    return results, out_path
+
+def compare(baseline_path, candidate_path):
+    """Print the p99 latency change per scenario between two result files"""
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+    with open(candidate_path) as f:
+        candidate = json.load(f)
+    print(f"📊 {baseline['commit']} -> {candidate['commit']} ({candidate['dataset']})")
+    for name, result in candidate["scenarios"].items():
+        before = baseline["scenarios"].get(name, {}).get("p99_ms")
+        after = result.get("p99_ms")
+        if before and after:
+            print(f"   {name}: p99 {before}ms -> {after}ms ({(after - before) / before:+.0%})")
+        else:
+            print(f"   {name}: p99 {before} -> {after}")
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Benchmark the Workforce Distribution.ai API")
+    subcommands = parser.add_subparsers(dest="command", required=True)
+
+    generate = subcommands.add_parser("generate", help="write synthetic datasets")
+    generate.add_argument("--size", choices=SIZES, default="10k")
+    generate.add_argument("--seed", type=int, default=0)
+    generate.add_argument("--candidates-json", action="store_true",
+                          help="also write jobs/candidates in the sample_data.py schema as NDJSON")
+
+    bench = subcommands.add_parser("run", help="import a dataset and drive the API")
+    bench.add_argument("--size", choices=SIZES, default="10k")
+    bench.add_argument("--repeat", type=int, default=50, help="requests per endpoint")
+    bench.add_argument("--server-pid", type=int, help="backend pid, to record its peak RSS")
+    bench.add_argument("--skip-import", action="store_true", help="benchmark an already loaded database")
+    bench.add_argument("--seed", type=int, default=0)
+
+    diff = subcommands.add_parser("compare", help="compare two result files")
+    diff.add_argument("baseline")
+    diff.add_argument("candidate")
+
+    args = parser.parse_args()
+
+    if args.command == "generate":
+        data_dir = os.path.join(DATA_DIR, args.size)
+        paths = generate_attrition_csv(SIZES[args.size], data_dir, args.seed)
+        print(f"✅ Wrote {SIZES[args.size]:,} employees to {len(paths)} files in {data_dir}")
+        if args.candidates_json:
+            # About as many jobs as candidates, like the shipped database
+            # (1,433 jobs to 1,233 candidates)
+            candidates = SIZES[args.size]
+            for name, records in (("candidates", generate_candidates(candidates, args.seed)),
+                                  ("jobs", generate_jobs(candidates * 7 // 6, args.seed))):
+                path = os.path.join(data_dir, f"{name}.ndjson")
+                with open(path, "w") as f:
+                    for record in records:
+                        f.write(json.dumps(record) + "\n")
+                print(f"✅ Wrote {path}")
+        return True
+
+    if args.command == "compare":
+        compare(args.baseline, args.candidate)
+        return True
+
+    try:
+        requests.get(f"{API_BASE_URL}/health", timeout=5)
+    except requests.exceptions.ConnectionError:
+        print(f"❌ Cannot connect to backend server. Please make sure it's running at {API_BASE_URL}")
+        return False
+
+    results, out_path = run(args.size, args.repeat, args.server_pid, args.skip_import, args.seed)
+    print("\n📊 Results:")
+    for name, result in results["scenarios"].items():
+        print(f"   {name}: p50 {result['p50_ms']}ms, p95 {result['p95_ms']}ms, p99 {result['p99_ms']}ms, "
+              f"{result['throughput_rps']} req/s, {result['errors']} errors")
+    print(f"   Peak RSS: {results['peak_rss_mb']}")
+    print(f"✅ Saved to {out_path}")
+    return True
+
+if __name__ == "__main__":
+    main()
@@ -4,20 +4,59 @@ Script to import HR Employee Attrition CSV data into Workforce Distribution.ai
 """
 
 import requests
+import argparse
+import csv
+import glob
+import hashlib
 import json
 import os
+import queue
+import sqlite3
 import sys
+import threading
+import time
+
+from api_client import client
 
 # Add the backend directory to the Python path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'backend'))
 
-API_BASE_URL = "http://localhost:8000/api/v1"
 CSV_FILE_PATH = "WA_Fn-UseC_-HR-Employee-Attrition.csv"
+CHUNK_DIR = ".import_chunks"
+CHECKPOINT_FILE = os.path.join(CHUNK_DIR, "checkpoint.json")
+MULTI_FILE_MANIFEST = os.path.join(CHUNK_DIR, "multi_file_manifest.json")
+# EmployeeNumber -> fingerprint of the last imported row, used for
+# deduplication across files and for delta re-imports
+EMPLOYEE_STATE_DB = os.path.join(CHUNK_DIR, "employee_state.db")
+DELTA_CHANGES_FILE = os.path.join(CHUNK_DIR, "delta_changes.csv")
+DEFAULT_CHUNK_SIZE = 500
+# Parsed chunks that may wait for the writer in a multi-file import
+QUEUED_CHUNKS = 8
+# How the import endpoint derives a candidate from a CSV row (every
+# candidate in workforce_ai.db matches these rules); used to apply changes
+CANDIDATE_EMAIL = "employee{}@company.com"
+EDUCATION_LEVELS = {"1": "High School", "2": "Associate", "3": "Bachelor", "4": "Master", "5": "PhD"}
+JOB_ROLE_POSITIONS = {
+    "Sales Executive": "Sales Representative",
+    "Sales Representative": "Sales Representative",
+    "Research Scientist": "Data Scientist",
+    "Laboratory Technician": "Research Assistant",
+    "Manufacturing Director": "Operations Manager",
+    "Healthcare Representative": "Healthcare Specialist",
+    "Manager": "Department Manager",
+    "Research Director": "Research Manager",
+    "Human Resources": "HR Specialist"
+}
+CANDIDATE_PAGE_SIZE = 500
+PROFILE_CACHE_DIR = ".csv_profile_cache"
+# Bytes hashed from each end of the file; together with size and mtime this
+# identifies a file version without reading multi-GB exports end to end
+PROFILE_HASH_BYTES = 1024 * 1024
 
 def test_api_connection():
     """Test if the API is running"""
     try:
-        response = requests.get(f"{API_BASE_URL}/health")
+        response = client.get("/health", ttl=0)
         if response.status_code == 200:
             print("✅ API is running and accessible")
             return True
@@ -28,44 +67,75 @@ def test_api_connection():
         print("❌ Cannot connect to API. Make sure the backend server is running on http://localhost:8000")
         return False
 
+def file_fingerprint(file_path):
+    """Identify a file version by path, mtime, size and a hash of its head and tail"""
+    stat = os.stat(file_path)
+    digest = hashlib.blake2b(digest_size=16)
+    with open(file_path, "rb") as f:
+        digest.update(f.read(PROFILE_HASH_BYTES))
+        if stat.st_size > 2 * PROFILE_HASH_BYTES:
+            f.seek(-PROFILE_HASH_BYTES, os.SEEK_END)
+            digest.update(f.read())
+    return f"{os.path.abspath(file_path)}|{stat.st_mtime_ns}|{stat.st_size}|{digest.hexdigest()}"
+
+def fetch_csv_profile(endpoint, file_path, **params):
+    """GET a CSV profile endpoint, served from the local cache while the file is unchanged"""
+    key = hashlib.sha256(
+        json.dumps([endpoint, file_fingerprint(file_path), params], sort_keys=True).encode()
+    ).hexdigest()
+    cache_path = os.path.join(PROFILE_CACHE_DIR, f"{key}.json")
+    if os.path.exists(cache_path):
+        with open(cache_path) as f:
+            return json.load(f), True
+
+    response = client.get(f"/data-import/csv/{endpoint}",
+                          params={"file_path": file_path, **params}, ttl=0)
+    if response.status_code != 200:
+        raise RuntimeError(response.text)
+    profile = response.json()
+    os.makedirs(PROFILE_CACHE_DIR, exist_ok=True)
+    tmp_path = cache_path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(profile, f)
+    os.replace(tmp_path, cache_path)
+    return profile, False
+
 def get_csv_summary():
     """Get summary of the CSV data"""
     try:
-        response = requests.get(f"{API_BASE_URL}/data-import/csv/summary?file_path={CSV_FILE_PATH}")
-        if response.status_code == 200:
-            summary = response.json()
-            print("\n📊 CSV Data Summary:")
-            print(f"   Total Records: {summary['total_records']}")
-            print(f"   Active Employees: {summary['active_employees']}")
-            print(f"   Attrition Rate: {summary['attrition_rate']:.1f}%")
-            print(f"   Unique Job Roles: {summary['unique_job_roles']}")
-            print(f"   Unique Departments: {summary['unique_departments']}")
-            
-            print(f"\n💰 Salary Statistics:")
-            salary_stats = summary['salary_statistics']
-            print(f"   Min: ${salary_stats['min']:,.0f}")
-            print(f"   Max: ${salary_stats['max']:,.0f}")
-            print(f"   Mean: ${salary_stats['mean']:,.0f}")
-            print(f"   Median: ${salary_stats['median']:,.0f}")
-            
-            print(f"\n📈 Experience Statistics:")
-            exp_stats = summary['experience_statistics']
-            print(f"   Min: {exp_stats['min']:.1f} years")
-            print(f"   Max: {exp_stats['max']:.1f} years")
-            print(f"   Mean: {exp_stats['mean']:.1f} years")
-            
-            print(f"\n🏢 Job Roles Distribution:")
-            for role, count in summary['job_roles'].items():
-                print(f"   {role}: {count}")
-            
-            print(f"\n📋 Departments Distribution:")
-            for dept, count in summary['departments'].items():
-                print(f"   {dept}: {count}")
-            
-            return summary
-        else:
-            print(f"❌ Error getting summary: {response.text}")
-            return None
+        summary, cached = fetch_csv_profile("summary", CSV_FILE_PATH)
+        print("\n📊 CSV Data Summary:" + (" (cached profile)" if cached else ""))
+        print(f"   Total Records: {summary['total_records']}")
+        print(f"   Active Employees: {summary['active_employees']}")
+        print(f"   Attrition Rate: {summary['attrition_rate']:.1f}%")
+        print(f"   Unique Job Roles: {summary['unique_job_roles']}")
+        print(f"   Unique Departments: {summary['unique_departments']}")
+        
+        print(f"\n💰 Salary Statistics:")
+        salary_stats = summary['salary_statistics']
+        print(f"   Min: ${salary_stats['min']:,.0f}")
+        print(f"   Max: ${salary_stats['max']:,.0f}")
+        print(f"   Mean: ${salary_stats['mean']:,.0f}")
+        print(f"   Median: ${salary_stats['median']:,.0f}")
+        
+        print(f"\n📈 Experience Statistics:")
+        exp_stats = summary['experience_statistics']
+        print(f"   Min: {exp_stats['min']:.1f} years")
+        print(f"   Max: {exp_stats['max']:.1f} years")
+        print(f"   Mean: {exp_stats['mean']:.1f} years")
+        
+        print(f"\n🏢 Job Roles Distribution:")
+        for role, count in summary['job_roles'].items():
+            print(f"   {role}: {count}")
+        
+        print(f"\n📋 Departments Distribution:")
+        for dept, count in summary['departments'].items():
+            print(f"   {dept}: {count}")
+        
+        return summary
+    except RuntimeError as e:
+        print(f"❌ Error getting summary: {str(e)}")
+        return None
     except Exception as e:
         print(f"❌ Error: {str(e)}")
         return None
@@ -73,25 +143,23 @@ def get_csv_summary():
 def preview_csv_data():
     """Preview the CSV data"""
     try:
-        response = requests.get(f"{API_BASE_URL}/data-import/csv/preview?file_path={CSV_FILE_PATH}&rows=5")
-        if response.status_code == 200:
-            preview = response.json()
-            print(f"\n👀 CSV Preview (first 5 rows):")
-            print(f"   Total Rows: {preview['total_rows']}")
-            print(f"   Total Columns: {preview['total_columns']}")
-            
-            print(f"\n📋 Columns:")
-            for col in preview['columns_info'][:10]:  # Show first 10 columns
-                print(f"   {col['name']} ({col['type']}) - {col['unique_values']} unique values")
-            
-            print(f"\n📄 Sample Data:")
-            for i, row in enumerate(preview['preview_data'][:3]):  # Show first 3 rows
-                print(f"   Row {i+1}: {dict(list(row.items())[:5])}...")  # Show first 5 columns
-            
-            return preview
-        else:
-            print(f"❌ Error getting preview: {response.text}")
-            return None
+        preview, cached = fetch_csv_profile("preview", CSV_FILE_PATH, rows=5)
+        print(f"\n👀 CSV Preview (first 5 rows):" + (" (cached profile)" if cached else ""))
+        print(f"   Total Rows: {preview['total_rows']}")
+        print(f"   Total Columns: {preview['total_columns']}")
+        
+        print(f"\n📋 Columns:")
+        for col in preview['columns_info'][:10]:  # Show first 10 columns
+            print(f"   {col['name']} ({col['type']}) - {col['unique_values']} unique values")
+        
+        print(f"\n📄 Sample Data:")
+        for i, row in enumerate(preview['preview_data'][:3]):  # Show first 3 rows
+            print(f"   Row {i+1}: {dict(list(row.items())[:5])}...")  # Show first 5 columns
+        
+        return preview
+    except RuntimeError as e:
+        print(f"❌ Error getting preview: {str(e)}")
+        return None
     except Exception as e:
         print(f"❌ Error: {str(e)}")
         return None
@@ -101,7 +169,7 @@ def import_csv_data():
     try:
         print(f"\n🚀 Importing CSV data from: {CSV_FILE_PATH}")
         
-        response = requests.post(f"{API_BASE_URL}/data-import/csv/import-from-path?file_path={CSV_FILE_PATH}")
+        response = client.post("/data-import/csv/import-from-path", params={"file_path": CSV_FILE_PATH})
         
         if response.status_code == 200:
             result = response.json()
@@ -110,7 +178,6 @@ def import_csv_data():
             print(f"   Candidates Created: {result['candidates_created']}")
             print(f"   Skills Created: {result['skills_created']}")
             print(f"   Total Records Processed: {result['total_records']}")
-            return result
         else:
             print(f"❌ Import failed: {response.text}")
             return None
@@ -118,25 +185,567 @@ def import_csv_data():
         print(f"❌ Error during import: {str(e)}")
         return None
 
+    # The import has been committed at this point; failing to record it only
+    # affects later --delta runs, so it is reported but does not fail the import
+    try:
+        for header, rows in iter_csv_chunks(CSV_FILE_PATH, DEFAULT_CHUNK_SIZE):
+            record_employees(header, rows)
+    except Exception as e:
+        print(f"⚠️  Imported, but could not record the employees for --delta: {str(e)}")
+        print("   Run the script with --baseline to record them")
+    return result
+
+def iter_csv_chunks(file_path, chunk_size):
+    """Yield (header, rows) chunks of the CSV without loading the whole file"""
+    with open(file_path, newline='', encoding='utf-8-sig') as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        chunk = []
+        for row in reader:
+            chunk.append(row)
+            if len(chunk) >= chunk_size:
+                yield header, chunk
+                chunk = []
+        if chunk:
+            yield header, chunk
+
+def row_fingerprint(row):
+    """Hash a CSV row so changed employees can be detected without storing the row"""
+    return hashlib.blake2b("\x1f".join(row).encode(), digest_size=16).hexdigest()
+
+def open_employee_state():
+    """Open the local EmployeeNumber state store"""
+    os.makedirs(CHUNK_DIR, exist_ok=True)
+    connection = sqlite3.connect(EMPLOYEE_STATE_DB)
+    # fingerprint/attrition describe the row the candidate currently reflects;
+    # the reported_* columns the last change a delta import could not apply.
+    # source is the --input file the employee was imported from.
+    connection.execute(
+        "CREATE TABLE IF NOT EXISTS employees ("
+        "employee_number TEXT PRIMARY KEY, fingerprint TEXT NOT NULL, attrition TEXT, "
+        "reported_fingerprint TEXT, reported_attrition TEXT, source TEXT)"
+    )
+    return connection
+
+def record_employees(header, rows, source=None):
+    """Remember the rows that were just committed, keyed on EmployeeNumber"""
+    key = header.index("EmployeeNumber")
+    attrition = header.index("Attrition")
+    connection = open_employee_state()
+    try:
+        with connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO employees (employee_number, fingerprint, attrition, source) "
+                "VALUES (?, ?, ?, ?)",
+                [(row[key], row_fingerprint(row), row[attrition], source) for row in rows]
+            )
+    finally:
+        connection.close()
+
+def mark_reported(header, rows):
+    """Remember the changed rows a delta import reported, so they are reported once"""
+    key = header.index("EmployeeNumber")
+    attrition = header.index("Attrition")
+    connection = open_employee_state()
+    try:
+        with connection:
+            connection.executemany(
+                "UPDATE employees SET reported_fingerprint = ?, reported_attrition = ? "
+                "WHERE employee_number = ?",
+                [(row_fingerprint(row), row[attrition], row[key]) for row in rows]
+            )
+    finally:
+        connection.close()
+
+def known_employees(employee_numbers):
+    """Map the already imported EmployeeNumbers to
+    (fingerprint, attrition, reported_fingerprint, reported_attrition, source)"""
+    employee_numbers = list(employee_numbers)
+    known = {}
+    connection = open_employee_state()
+    try:
+        for offset in range(0, len(employee_numbers), 500):
+            batch = employee_numbers[offset:offset + 500]
+            known.update(
+                (row[0], row[1:])
+                for row in connection.execute(
+                    "SELECT employee_number, fingerprint, attrition, reported_fingerprint, "
+                    "reported_attrition, source FROM employees "
+                    f"WHERE employee_number IN ({', '.join('?' * len(batch))})", batch
+                )
+            )
+    finally:
+        connection.close()
+    return known
+
+def load_checkpoint(file_path, chunk_size):
+    """Load the resume checkpoint if it belongs to this file and chunk size"""
+    stat = os.stat(file_path)
+    key = {
+        "file_path": os.path.abspath(file_path),
+        "size": stat.st_size,
+        "mtime": stat.st_mtime,
+        "chunk_size": chunk_size
+    }
+    checkpoint = {**key, "chunks_committed": 0, "rows_committed": 0,
+                  "jobs_created": 0, "candidates_created": 0, "skills_created": 0}
+    if os.path.exists(CHECKPOINT_FILE):
+        with open(CHECKPOINT_FILE) as f:
+            saved = json.load(f)
+        if all(saved.get(k) == v for k, v in key.items()):
+            checkpoint.update(saved)
+    return checkpoint
+
+def save_checkpoint(checkpoint):
+    """Persist the checkpoint atomically after a chunk has been committed"""
+    tmp_path = CHECKPOINT_FILE + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(checkpoint, f, indent=2)
+    os.replace(tmp_path, CHECKPOINT_FILE)
+
+def import_csv_chunk(header, rows, chunk_index, source=None):
+    """Write one chunk to disk and import it in its own request/transaction"""
+    chunk_path = os.path.abspath(os.path.join(CHUNK_DIR, f"chunk_{chunk_index:06d}.csv"))
+    with open(chunk_path, "w", newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        writer.writerows(rows)
+    try:
+        response = client.post(
+            "/data-import/csv/import-from-path",
+            params={"file_path": chunk_path}
+        )
+    finally:
+        os.remove(chunk_path)
+    if response.status_code != 200:
+        raise RuntimeError(f"chunk {chunk_index} failed: {response.text}")
+    record_employees(header, rows, source)
+    return response.json()
+
+def import_csv_data_chunked(file_path=CSV_FILE_PATH, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Stream the CSV to the API in fixed-size chunks, resuming after interruptions"""
+    os.makedirs(CHUNK_DIR, exist_ok=True)
+    checkpoint = load_checkpoint(file_path, chunk_size)
+    skip = checkpoint["chunks_committed"]
+
+    print(f"\n🚀 Importing CSV data from: {file_path} in chunks of {chunk_size} rows")
+    if skip:
+        print(f"   Resuming after chunk {skip} ({checkpoint['rows_committed']} rows already committed)")
+
+    started = time.perf_counter()
+    rows_this_run = 0
+    try:
+        for index, (header, rows) in enumerate(iter_csv_chunks(file_path, chunk_size), 1):
+            if index <= skip:
+                continue
+            chunk_started = time.perf_counter()
+            # A chunk interrupted between record_employees() and save_checkpoint()
+            # is missing from the checkpoint but already in the state store
+            key = header.index("EmployeeNumber")
+            known = known_employees(row[key] for row in rows)
+            fresh = [row for row in rows if row[key] not in known]
+            result = import_csv_chunk(header, fresh, index) if fresh else {}
+            chunk_elapsed = time.perf_counter() - chunk_started
+
+            for field in ("jobs_created", "candidates_created", "skills_created"):
+                checkpoint[field] += result.get(field, 0)
+            checkpoint["chunks_committed"] = index
+            checkpoint["rows_committed"] += len(rows)
+            save_checkpoint(checkpoint)
+
+            rows_this_run += len(rows)
+            print(f"   Chunk {index}: {len(rows)} rows in {chunk_elapsed:.2f}s "
+                  f"({len(rows) / max(chunk_elapsed, 1e-9):,.0f} rows/sec)" +
+                  (f", {len(rows) - len(fresh)} already imported" if len(fresh) < len(rows) else ""))
+    except Exception as e:
+        print(f"❌ Import interrupted: {str(e)}")
+        print(f"   Re-run the import to resume after chunk {checkpoint['chunks_committed']}")
+        return None
+
+    elapsed = time.perf_counter() - started
+    # A file without data rows never saves a checkpoint
+    if os.path.exists(CHECKPOINT_FILE):
+        os.remove(CHECKPOINT_FILE)
+
+    print("✅ Data imported successfully!")
+    print(f"   Jobs Created: {checkpoint['jobs_created']}")
+    print(f"   Candidates Created: {checkpoint['candidates_created']}")
+    print(f"   Skills Created: {checkpoint['skills_created']}")
+    print(f"   Total Records Processed: {checkpoint['rows_committed']}")
+    print(f"   Throughput: {rows_this_run / max(elapsed, 1e-9):,.0f} rows/sec")
+    return {
+        "jobs_created": checkpoint["jobs_created"],
+        "candidates_created": checkpoint["candidates_created"],
+        "skills_created": checkpoint["skills_created"],
+        "total_records": checkpoint["rows_committed"],
+        "rows_per_second": rows_this_run / max(elapsed, 1e-9)
+    }
+
+def resolve_input_files(pattern):
+    """Expand a directory or glob pattern into a sorted list of CSV files"""
+    if os.path.isdir(pattern):
+        pattern = os.path.join(pattern, "*.csv")
+    return sorted(path for path in glob.glob(pattern) if os.path.isfile(path))
+
+def iter_unique_chunks(file_path, chunk_size):
+    """Stream a CSV in chunks, keeping only the last row per EmployeeNumber
+
+    Yields (header, rows, duplicates), where duplicates counts the rows
+    dropped since the previous chunk. A first pass only records the line of
+    each employee's last row, so memory grows with the number of employees,
+    not with the size of the file.
+    """
+    with open(file_path, newline='', encoding='utf-8-sig') as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        key = header.index("EmployeeNumber")
+        last_line = {row[key]: line for line, row in enumerate(reader)}
+
+    with open(file_path, newline='', encoding='utf-8-sig') as f:
+        reader = csv.reader(f)
+        next(reader)
+        chunk = []
+        duplicates = 0
+        for line, row in enumerate(reader):
+            if last_line[row[key]] != line:
+                duplicates += 1
+                continue
+            chunk.append(row)
+            if len(chunk) >= chunk_size:
+                yield header, chunk, duplicates
+                chunk = []
+                duplicates = 0
+        if chunk or duplicates:
+            yield header, chunk, duplicates
+
+def load_multi_file_manifest():
+    """Load the fingerprints of files fully committed by earlier runs"""
+    if os.path.exists(MULTI_FILE_MANIFEST):
+        with open(MULTI_FILE_MANIFEST) as f:
+            return set(json.load(f)["files"])
+    return set()
+
+def save_multi_file_manifest(files):
+    """Persist the committed file fingerprints atomically"""
+    tmp_path = MULTI_FILE_MANIFEST + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump({"files": sorted(files)}, f)
+    os.replace(tmp_path, MULTI_FILE_MANIFEST)
+
+def import_csv_files(files, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Import many extracts in order: one parser thread, a single writer, dedup on EmployeeNumber"""
+    os.makedirs(CHUNK_DIR, exist_ok=True)
+    done_files = load_multi_file_manifest()
+    fingerprints = {path: file_fingerprint(path) for path in files}
+    pending = [path for path in files if fingerprints[path] not in done_files]
+    status = {path: {"status": "skipped (already imported)" if path not in pending else "queued",
+                     "rows": 0, "previous_run": 0, "duplicates": 0} for path in files}
+
+    print(f"\n🚀 Importing {len(pending)} of {len(files)} files in chunks of {chunk_size} rows")
+
+    # Backpressure: the parser blocks once QUEUED_CHUNKS chunks wait for the
+    # writer. Files are parsed and committed in sorted order and nothing after
+    # a failed file is committed, so when extracts overlap the employee's row
+    # from the first file wins.
+    batches = queue.Queue(maxsize=QUEUED_CHUNKS)
+    stop = threading.Event()
+
+    def produce():
+        try:
+            for path in pending:
+                if stop.is_set():
+                    break
+                try:
+                    for header, rows, duplicates in iter_unique_chunks(path, chunk_size):
+                        if stop.is_set():
+                            break
+                        batches.put(("chunk", path, header, rows, duplicates))
+                    batches.put(("done", path))
+                except Exception as e:
+                    batches.put(("failed", path, e))
+        finally:
+            # Always wake the writer, even if the parser dies
+            batches.put(None)
+
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
+
+    started = time.perf_counter()
+    totals = {"jobs_created": 0, "candidates_created": 0, "skills_created": 0, "total_records": 0}
+    chunk_index = 0
+    while True:
+        item = batches.get()
+        if item is None:
+            break
+        kind, path = item[0], item[1]
+        if stop.is_set():
+            # Drain what the parser queued before it saw the failure
+            continue
+        if kind == "failed":
+            status[path]["status"] = f"failed: {str(item[2])}"
+            stop.set()
+        elif kind == "done":
+            done_files.add(fingerprints[path])
+            save_multi_file_manifest(done_files)
+            status[path]["status"] = "imported"
+        else:
+            header, rows, duplicates = item[2:]
+            source = os.path.abspath(path)
+            status[path]["status"] = "importing"
+            try:
+                key = header.index("EmployeeNumber")
+                # Employees committed from earlier files or runs are in the
+                # state store; those from this file were committed by a
+                # previous run that failed part way through it
+                seen = known_employees(row[key] for row in rows)
+                fresh = [row for row in rows if row[key] not in seen]
+                previous_run = sum(1 for row in rows if row[key] in seen and seen[row[key]][4] == source)
+                status[path]["previous_run"] += previous_run
+                status[path]["duplicates"] += duplicates + len(rows) - len(fresh) - previous_run
+                if fresh:
+                    chunk_index += 1
+                    result = import_csv_chunk(header, fresh, chunk_index, source)
+                    for field in ("jobs_created", "candidates_created", "skills_created"):
+                        totals[field] += result.get(field, 0)
+                    totals["total_records"] += len(fresh)
+                    status[path]["rows"] += len(fresh)
+            except Exception as e:
+                status[path]["status"] = f"failed: {str(e)}"
+                stop.set()
+    producer.join()
+    elapsed = time.perf_counter() - started
+    for path in pending:
+        if status[path]["status"] == "queued" and stop.is_set():
+            status[path]["status"] = "skipped (an earlier file failed)"
+        elif status[path]["status"] in ("queued", "importing"):
+            status[path]["status"] = "failed: parser stopped before the file was finished"
+
+    print("\n📁 Per-file status:")
+    for path in files:
+        info = status[path]
+        print(f"   {os.path.basename(path)}: {info['status']} - {info['rows']} rows, " +
+              (f"{info['previous_run']} rows imported by a previous run, " if info["previous_run"] else "") +
+              f"{info['duplicates']} duplicate employees skipped")
+    print(f"   Throughput: {totals['total_records'] / max(elapsed, 1e-9):,.0f} rows/sec")
+
+    if stop.is_set():
+        print("❌ A file failed and the files after it were not imported; re-run the import to retry them")
+        return None
+    print("✅ Data imported successfully!")
+    print(f"   Jobs Created: {totals['jobs_created']}")
+    print(f"   Candidates Created: {totals['candidates_created']}")
+    print(f"   Skills Created: {totals['skills_created']}")
+    print(f"   Total Records Processed: {totals['total_records']}")
+    return totals
+
+def classify_rows(header, rows, known):
+    """Sort rows into new, changed and unchanged employees against the state store
+
+    known is the result of known_employees() for these rows. Applied changes
+    update the stored fingerprint; a change that could not be applied is
+    returned once, and while the row stays as reported it is counted as
+    already reported instead. Attrition flips are measured against the last
+    reported row, or the applied one.
+    """
+    key = header.index("EmployeeNumber")
+    attrition = header.index("Attrition")
+    result = {"new": [], "changed": [], "flipped": [], "unchanged": 0, "already_reported": 0}
+    for row in rows:
+        previous = known.get(row[key])
+        if previous is None:
+            result["new"].append(row)
+            continue
+        fingerprint, imported_attrition, reported_fingerprint, reported_attrition, _ = previous
+        current = row_fingerprint(row)
+        if current == fingerprint:
+            result["unchanged"] += 1
+        elif current == reported_fingerprint:
+            result["already_reported"] += 1
+        else:
+            result["changed"].append(row)
+            if (reported_attrition or imported_attrition) != "Yes" and row[attrition] == "Yes":
+                result["flipped"].append(row[key])
+    return result
+
+def candidate_fields(header, row):
+    """The candidate fields the import derives from a CSV row, for PUT /candidates/{id}"""
+    value = dict(zip(header, row))
+    fields = {
+        "last_name": f"From{value['Department']}",
+        "years_experience": float(value["TotalWorkingYears"]),
+        "expected_salary": float(value["MonthlyIncome"]) * 12,
+        "preferred_departments": [value["Department"]]
+    }
+    if value["JobRole"] in JOB_ROLE_POSITIONS:
+        fields["current_position"] = JOB_ROLE_POSITIONS[value["JobRole"]]
+    if value["Education"] in EDUCATION_LEVELS:
+        fields["education_level"] = EDUCATION_LEVELS[value["Education"]]
+    # Availability is only ever taken away; a recruiter may have changed it
+    if value["Attrition"] == "Yes":
+        fields["is_available"] = False
+    return fields
+
+def find_candidate_ids(employee_numbers):
+    """Map EmployeeNumbers to candidate ids by paging through GET /candidates/"""
+    wanted = {CANDIDATE_EMAIL.format(number): number for number in employee_numbers}
+    ids = {}
+    skip = 0
+    while len(ids) < len(wanted):
+        response = client.get("/candidates/", params={"skip": skip, "limit": CANDIDATE_PAGE_SIZE}, ttl=0)
+        if response.status_code != 200:
+            raise RuntimeError(f"listing candidates failed: {response.text}")
+        page = response.json()
+        # The candidate list is returned next to "total"
+        candidates = page if isinstance(page, list) else \
+            next((value for value in page.values() if isinstance(value, list)), [])
+        for candidate in candidates:
+            number = wanted.get(candidate.get("email"))
+            if number is not None:
+                ids[number] = candidate["id"]
+        if len(candidates) < CANDIDATE_PAGE_SIZE:
+            break
+        skip += CANDIDATE_PAGE_SIZE
+    return ids
+
+def apply_changes(header, rows):
+    """Update the candidates of changed rows; return (applied, failed) rows"""
+    key = header.index("EmployeeNumber")
+    ids = find_candidate_ids(row[key] for row in rows)
+    applied, failed = [], []
+    for row in rows:
+        # Employees that left before their first import never became candidates
+        candidate_id = ids.get(row[key])
+        if candidate_id is None:
+            failed.append(row)
+            continue
+        response = client.put(f"/candidates/{candidate_id}", json=candidate_fields(header, row))
+        (applied if response.status_code == 200 else failed).append(row)
+    if applied:
+        record_employees(header, applied)
+    return applied, failed
+
+def import_csv_delta(file_path=CSV_FILE_PATH, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Import new employees and update the candidates of rows that changed since the last import"""
+    print(f"\n🚀 Delta import from: {file_path}")
+    started = time.perf_counter()
+    totals = {"jobs_created": 0, "candidates_created": 0, "skills_created": 0, "total_records": 0}
+    new_rows, changed_rows, flipped = [], [], []
+    unchanged = already_reported = duplicates = 0
+    chunk_index = 0
+
+    def flush(header, rows):
+        nonlocal chunk_index
+        chunk_index += 1
+        result = import_csv_chunk(header, rows, chunk_index)
+        for field in ("jobs_created", "candidates_created", "skills_created"):
+            totals[field] += result.get(field, 0)
+        totals["total_records"] += len(rows)
+
+    header = None
+    try:
+        # An employee listed twice in the extract is taken from its last row,
+        # as in a multi-file import; sending both would fail the whole chunk
+        for header, rows, dropped in iter_unique_chunks(file_path, chunk_size):
+            key = header.index("EmployeeNumber")
+            result = classify_rows(header, rows, known_employees(row[key] for row in rows))
+            new_rows.extend(result["new"])
+            changed_rows.extend(result["changed"])
+            flipped.extend(result["flipped"])
+            unchanged += result["unchanged"]
+            already_reported += result["already_reported"]
+            duplicates += dropped
+            while len(new_rows) >= chunk_size:
+                flush(header, new_rows[:chunk_size])
+                new_rows = new_rows[chunk_size:]
+        if new_rows:
+            flush(header, new_rows)
+    except Exception as e:
+        print(f"❌ Delta import interrupted: {str(e)}")
+        print("   Re-run the import; employees already committed will not be imported again")
+        return None
+
+    applied, failed = [], []
+    if changed_rows:
+        try:
+            applied, failed = apply_changes(header, changed_rows)
+        except Exception as e:
+            print(f"❌ Could not update changed candidates: {str(e)}")
+            failed = changed_rows
+
+    # Changes that could not be applied are appended to the review file once;
+    # delete the file after review
+    if failed:
+        write_header = not os.path.exists(DELTA_CHANGES_FILE)
+        with open(DELTA_CHANGES_FILE, "a", newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            if write_header:
+                writer.writerow(header)
+            writer.writerows(failed)
+        mark_reported(header, failed)
+
+    key = header.index("EmployeeNumber") if header else None
+    applied_numbers = {row[key] for row in applied}
+    unavailable = [number for number in flipped if number in applied_numbers]
+    flip_failed = [number for number in flipped if number not in applied_numbers]
+
+    elapsed = time.perf_counter() - started
+    print("✅ Delta import completed!")
+    print(f"   New Employees Imported: {totals['total_records']}")
+    print(f"   Jobs Created: {totals['jobs_created']}")
+    print(f"   Candidates Created: {totals['candidates_created']}")
+    print(f"   Unchanged Employees Skipped: {unchanged}")
+    if duplicates:
+        print(f"   Duplicate Rows Skipped: {duplicates} (last row per EmployeeNumber kept)")
+    print(f"   Changed Candidates Updated: {len(applied)}")
+    if unavailable:
+        print(f"   Marked Unavailable (Attrition flipped to 'Yes'): {len(unavailable)}")
+    if failed:
+        print(f"   ⚠️  {len(failed)} changes could not be applied (appended to {DELTA_CHANGES_FILE})" +
+              (f", including attrition flips for: {', '.join(flip_failed[:20])}" if flip_failed else "") +
+              (" ..." if len(flip_failed) > 20 else ""))
+    if already_reported:
+        print(f"   Changes Already Reported: {already_reported}")
+    print(f"   Elapsed: {elapsed:.2f}s")
+    return {**totals, "unchanged": unchanged, "changed": len(changed_rows), "updated": len(applied),
+            "failed": len(failed), "already_reported": already_reported, "duplicates": duplicates,
+            "attrition_flipped": flipped, "marked_unavailable": unavailable}
+
+def reset_employee_state():
+    """Forget every imported employee; only correct once the database has been wiped too"""
+    if os.path.exists(EMPLOYEE_STATE_DB):
+        os.remove(EMPLOYEE_STATE_DB)
+    print("🗑️  Forgot all imported employees")
+
+def record_baseline(file_path=CSV_FILE_PATH):
+    """Record every row of an already imported file as the delta baseline"""
+    count = 0
+    for header, rows, _ in iter_unique_chunks(file_path, DEFAULT_CHUNK_SIZE):
+        record_employees(header, rows)
+        count += len(rows)
+    print(f"✅ Recorded {count} employees from {file_path} as the delta baseline")
+    return count
+
 def verify_import():
     """Verify the imported data"""
     try:
         print(f"\n🔍 Verifying imported data...")
         
+        # Fetch jobs, candidates and dashboard stats in parallel
+        jobs_response, candidates_response, stats_response = client.get_many(
+            ["/jobs/", "/candidates/", "/analysis/dashboard/stats"]
+        )
+        
         # Check jobs
-        jobs_response = requests.get(f"{API_BASE_URL}/jobs/")
         if jobs_response.status_code == 200:
             jobs_data = jobs_response.json()
             print(f"   Jobs in system: {jobs_data['total']}")
         
         # Check candidates
-        candidates_response = requests.get(f"{API_BASE_URL}/candidates/")
         if candidates_response.status_code == 200:
             candidates_data = candidates_response.json()
             print(f"   Candidates in system: {candidates_data['total']}")
         
         # Check dashboard stats
-        stats_response = requests.get(f"{API_BASE_URL}/analysis/dashboard/stats")
         if stats_response.status_code == 200:
             stats = stats_response.json()
             print(f"   Total Jobs: {stats['total_jobs']}")
@@ -150,30 +759,69 @@ def verify_import():
         print(f"❌ Error verifying data: {str(e)}")
         return False
 
+def parse_args():
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Import HR Employee Attrition CSV data")
+    parser.add_argument("--chunk-size", type=int, default=0,
+                        help="stream the file in chunks of N rows (0 = single request)")
+    parser.add_argument("--restart", action="store_true",
+                        help="discard any saved checkpoint/manifest and start the import over")
+    parser.add_argument("--reset-state", action="store_true",
+                        help="forget which employees were imported (only after wiping the database)")
+    parser.add_argument("--input",
+                        help="directory or glob of CSV extracts to import in order (deduplicated on EmployeeNumber)")
+    parser.add_argument("--delta", action="store_true",
+                        help="import only employees not imported before, keyed on EmployeeNumber")
+    parser.add_argument("--baseline", action="store_true",
+                        help="record the CSV (or the --input files) as already imported "
+                             "(for databases loaded before --delta existed)")
+    args = parser.parse_args()
+    if args.delta and args.input:
+        parser.error("--delta imports a single extract and cannot be combined with --input; "
+                     "--input already skips employees imported before")
+    return args
+
 def main():
     """Main function"""
+    args = parse_args()
     print("🎯 HR Employee Attrition Data Import for Workforce Distribution.ai")
     print("=" * 60)
     
+    if args.input:
+        files = resolve_input_files(args.input)
+        if not files:
+            print(f"❌ No CSV files matched: {args.input}")
+            return
+        print(f"📁 Found {len(files)} CSV files:")
+        for path in files:
+            print(f"   {path}")
     # Check if CSV file exists
-    if not os.path.exists(CSV_FILE_PATH):
+    elif not os.path.exists(CSV_FILE_PATH):
         print(f"❌ CSV file not found: {CSV_FILE_PATH}")
         print("Please make sure the CSV file is in the same directory as this script.")
         return
     
-    # Test API connection
-    if not test_api_connection():
+    if args.baseline:
+        if args.reset_state:
+            reset_employee_state()
+        for path in files if args.input else [CSV_FILE_PATH]:
+            record_baseline(path)
         return
     
-    # Get CSV summary
-    summary = get_csv_summary()
-    if not summary:
+    # Test API connection
+    if not test_api_connection():
         return
     
-    # Preview CSV data
-    preview = preview_csv_data()
-    if not preview:
-        return
+    if not args.input:
+        # Get CSV summary
+        summary = get_csv_summary()
+        if not summary:
+            return
+        
+        # Preview CSV data
+        preview = preview_csv_data()
+        if not preview:
+            return
     
     # Ask for confirmation
     print(f"\n❓ Do you want to import this data into the system?")
@@ -187,7 +835,20 @@ def main():
         return
     
     # Import the data
-    import_result = import_csv_data()
+    if args.restart:
+        for path in (CHECKPOINT_FILE, MULTI_FILE_MANIFEST):
+            if os.path.exists(path):
+                os.remove(path)
+    if args.reset_state:
+        reset_employee_state()
+    if args.input:
+        import_result = import_csv_files(files, args.chunk_size or DEFAULT_CHUNK_SIZE)
+    elif args.delta:
+        import_result = import_csv_delta(CSV_FILE_PATH, args.chunk_size or DEFAULT_CHUNK_SIZE)
+    elif args.chunk_size > 0:
+        import_result = import_csv_data_chunked(CSV_FILE_PATH, args.chunk_size)
+    else:
+        import_result = import_csv_data()
     if not import_result:
         return
     
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Migration script that normalizes candidate and job skills into indexed
+association tables for Workforce Distribution.ai
+"""
+
+import argparse
+import os
+import sqlite3
+
+DEFAULT_DATABASE_URL = "sqlite:///./workforce_ai.db"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS candidate_skills (
+    candidate_id INTEGER NOT NULL,
+    skill_id INTEGER NOT NULL REFERENCES skills (id),
+    level FLOAT NOT NULL,
+    score FLOAT,
+    PRIMARY KEY (candidate_id, skill_id)
+);
+CREATE INDEX IF NOT EXISTS ix_candidate_skills_skill_level
+    ON candidate_skills (skill_id, level);
+
+CREATE TABLE IF NOT EXISTS job_skills (
+    job_id INTEGER NOT NULL,
+    skill_id INTEGER NOT NULL REFERENCES skills (id),
+    is_required BOOLEAN NOT NULL,
+    PRIMARY KEY (job_id, skill_id)
+);
+CREATE INDEX IF NOT EXISTS ix_job_skills_skill_required
+    ON job_skills (skill_id, is_required);
+"""
+
+def json_or_empty(column, empty):
+    """Feed json_each() an empty document instead of failing on NULL or malformed JSON"""
+    return f"CASE WHEN json_valid({column}) THEN {column} ELSE {empty} END"
+
+CANDIDATE_SKILLS_JSON = json_or_empty("c.skills", "json_object()")
+REQUIRED_SKILLS_JSON = json_or_empty("j.required_skills", "json_array()")
+PREFERRED_SKILLS_JSON = json_or_empty("j.preferred_skills", "json_array()")
+
+# Statements shared by the backfill and the triggers. {source} is either the
+# full table (backfill) or a single-row select of NEW (triggers), and
+# {skill_filter} optionally restricts the query to one skills row. Skill
+# names missing from the skills catalog are left unmapped; they are picked
+# up when the skill is added to the catalog.
+INSERT_CANDIDATE_SKILLS = f"""
+INSERT OR REPLACE INTO candidate_skills (candidate_id, skill_id, level, score)
+SELECT c.id, sk.id, s.value,
+       CASE WHEN json_valid(c.skill_scores) THEN json_extract(c.skill_scores, '$."' || s.key || '"') END
+FROM {{source}} AS c, json_each({CANDIDATE_SKILLS_JSON}) AS s
+JOIN skills AS sk ON sk.name = s.key
+WHERE s.type IN ('integer', 'real'){{skill_filter}};
+"""
+
+# Preferred skills first so that a skill listed in both ends up required
+INSERT_JOB_SKILLS = f"""
+INSERT OR REPLACE INTO job_skills (job_id, skill_id, is_required)
+SELECT j.id, sk.id, 0
+FROM {{source}} AS j, json_each({PREFERRED_SKILLS_JSON}) AS s
+JOIN skills AS sk ON sk.name = s.value
+WHERE s.type = 'text'{{skill_filter}};
+INSERT OR REPLACE INTO job_skills (job_id, skill_id, is_required)
+SELECT j.id, sk.id, 1
+FROM {{source}} AS j, json_each({REQUIRED_SKILLS_JSON}) AS s
+JOIN skills AS sk ON sk.name = s.value
+WHERE s.type = 'text'{{skill_filter}};
+"""
+
+def candidate_sync(source, skill_filter=""):
+    """SQL that (re)builds candidate_skills rows for the candidates in source"""
+    return INSERT_CANDIDATE_SKILLS.format(source=source, skill_filter=skill_filter)
+
+def job_sync(source, skill_filter=""):
+    """SQL that (re)builds job_skills rows for the jobs in source"""
+    return INSERT_JOB_SKILLS.format(source=source, skill_filter=skill_filter)
+
+NEW_CANDIDATE = "(SELECT NEW.id AS id, NEW.skills AS skills, NEW.skill_scores AS skill_scores)"
+NEW_JOB = "(SELECT NEW.id AS id, NEW.required_skills AS required_skills, NEW.preferred_skills AS preferred_skills)"
+NEW_SKILL = " AND sk.id = NEW.id"
+
+# The backend keeps writing the JSON columns, so the association tables are
+# kept in sync inside SQLite and the API stays unchanged. The triggers never
+# write to the skills catalog, and malformed JSON is skipped rather than
+# aborting the backend's write.
+TRIGGERS = f"""
+CREATE TRIGGER trg_candidate_skills_insert
+AFTER INSERT ON candidates BEGIN
+{candidate_sync(NEW_CANDIDATE)}
+END;
+
+CREATE TRIGGER trg_candidate_skills_update
+AFTER UPDATE OF skills, skill_scores ON candidates BEGIN
+DELETE FROM candidate_skills WHERE candidate_id = OLD.id;
+{candidate_sync(NEW_CANDIDATE)}
+END;
+
+CREATE TRIGGER trg_candidate_skills_delete
+AFTER DELETE ON candidates BEGIN
+DELETE FROM candidate_skills WHERE candidate_id = OLD.id;
+END;
+
+CREATE TRIGGER trg_job_skills_insert
+AFTER INSERT ON jobs BEGIN
+{job_sync(NEW_JOB)}
+END;
+
+CREATE TRIGGER trg_job_skills_update
+AFTER UPDATE OF required_skills, preferred_skills ON jobs BEGIN
+DELETE FROM job_skills WHERE job_id = OLD.id;
+{job_sync(NEW_JOB)}
+END;
+
+CREATE TRIGGER trg_job_skills_delete
+AFTER DELETE ON jobs BEGIN
+DELETE FROM job_skills WHERE job_id = OLD.id;
+END;
+
+CREATE TRIGGER trg_skills_insert
+AFTER INSERT ON skills BEGIN
+{candidate_sync("candidates", NEW_SKILL)}
+{job_sync("jobs", NEW_SKILL)}
+END;
+
+CREATE TRIGGER trg_skills_delete
+AFTER DELETE ON skills BEGIN
+DELETE FROM candidate_skills WHERE skill_id = OLD.id;
+DELETE FROM job_skills WHERE skill_id = OLD.id;
+END;
+"""
+
+TRIGGER_NAMES = [
+    "trg_candidate_skills_insert", "trg_candidate_skills_update", "trg_candidate_skills_delete",
+    "trg_job_skills_insert", "trg_job_skills_update", "trg_job_skills_delete",
+    "trg_skills_insert", "trg_skills_delete"
+]
+
+# Skill names used by candidates or jobs that are not in the skills catalog
+UNMAPPED_SKILLS = f"""
+SELECT s.key FROM candidates AS c, json_each({CANDIDATE_SKILLS_JSON}) AS s
+UNION
+SELECT s.value FROM jobs AS j, json_each({PREFERRED_SKILLS_JSON}) AS s
+UNION
+SELECT s.value FROM jobs AS j, json_each({REQUIRED_SKILLS_JSON}) AS s
+EXCEPT
+SELECT name FROM skills
+"""
+
+def database_path(database_url):
+    """Resolve the SQLite file path from a DATABASE_URL"""
+    prefix = "sqlite:///"
+    if not database_url.startswith(prefix):
+        raise ValueError(f"Only SQLite databases are supported, got: {database_url}")
+    return database_url[len(prefix):]
+
+def migrate(connection):
+    """Create the association tables and triggers, then backfill from the JSON columns"""
+    # Triggers are recreated so that re-running the script upgrades them
+    drop_triggers = "".join(f"DROP TRIGGER IF EXISTS {name};" for name in TRIGGER_NAMES)
+    with connection:
+        connection.executescript("BEGIN;" + SCHEMA + drop_triggers + TRIGGERS + """
+            DELETE FROM candidate_skills;
+            DELETE FROM job_skills;
+        """ + candidate_sync("candidates") + job_sync("jobs") + "COMMIT;")
+
+    candidate_rows = connection.execute("SELECT COUNT(*) FROM candidate_skills").fetchone()[0]
+    job_rows = connection.execute("SELECT COUNT(*) FROM job_skills").fetchone()[0]
+    unmapped = [row[0] for row in connection.execute(UNMAPPED_SKILLS)]
+    return candidate_rows, job_rows, unmapped
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Normalize skills into candidate_skills/job_skills tables")
+    parser.add_argument("--database-url", default=os.getenv("DATABASE_URL", DEFAULT_DATABASE_URL),
+                        help="SQLite DATABASE_URL (defaults to the DATABASE_URL environment variable)")
+    args = parser.parse_args()
+
+    print("🔧 Normalizing skill storage")
+    print("=" * 40)
+
+    path = database_path(args.database_url)
+    if not os.path.exists(path):
+        print(f"❌ Database not found: {path}")
+        return False
+
+    connection = sqlite3.connect(path)
+    try:
+        candidate_rows, job_rows, unmapped = migrate(connection)
+    except sqlite3.Error as e:
+        print(f"❌ Migration failed: {e}")
+        return False
+    finally:
+        connection.close()
+
+    print(f"✅ candidate_skills backfilled: {candidate_rows} rows")
+    print(f"✅ job_skills backfilled: {job_rows} rows")
+    if unmapped:
+        print(f"⚠️  {len(unmapped)} skill names are not in the skills catalog and stay unmapped "
+              f"until they are added: {', '.join(sorted(unmapped)[:20])}" +
+              (" ..." if len(unmapped) > 20 else ""))
+    print("\n📋 Example indexed query (candidates with Python >= 7):")
+    print("   SELECT cs.candidate_id FROM candidate_skills cs JOIN skills s ON s.id = cs.skill_id")
+    print("   WHERE s.name = 'Python' AND cs.level >= 7")
+    return True
+
+if __name__ == "__main__":
+    main()
@@ -8,11 +8,11 @@ import os
 import requests
 import json
 
+from api_client import client
+
 # Add the backend directory to the Python path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'backend'))
 
-API_BASE_URL = "http://localhost:8000/api/v1"
-
 def create_sample_jobs():
     """Create sample job roles"""
     jobs_data = [
@@ -71,7 +71,7 @@ def create_sample_jobs():
     
     print("Creating sample jobs...")
     for job_data in jobs_data:
-        response = requests.post(f"{API_BASE_URL}/jobs/", json=job_data)
+        response = client.post("/jobs/", json=job_data)
         if response.status_code == 200:
             print(f"✅ Created job: {job_data['title']}")
         else:
@@ -207,7 +207,7 @@ def create_sample_candidates():
     
     print("Creating sample candidates...")
     for candidate_data in candidates_data:
-        response = requests.post(f"{API_BASE_URL}/candidates/", json=candidate_data)
+        response = client.post("/candidates/", json=candidate_data)
         if response.status_code == 200:
             print(f"✅ Created candidate: {candidate_data['first_name']} {candidate_data['last_name']}")
         else:
@@ -220,7 +220,7 @@ def main():
     
     try:
         # Test API connection
-        response = requests.get(f"{API_BASE_URL}/health")
+        response = client.get("/health", ttl=0)
         if response.status_code != 200:
             print("❌ Backend server is not running. Please start it first.")
             return
@@ -4,21 +4,100 @@ Startup script for Workforce Distribution.ai Backend
 """
 
 import uvicorn
+import argparse
 import os
 import sys
 
 # Add the backend directory to the Python path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'backend'))
 
-if __name__ == "__main__":
-    print("🚀 Starting Workforce Distribution.ai Backend...")
-    print("📊 API will be available at: http://localhost:8000")
-    print("📚 Documentation will be available at: http://localhost:8000/docs")
-    
+APP = "app.main:app"
+
+def parse_args():
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Start the Workforce Distribution.ai backend")
+    parser.add_argument("--production", action="store_true",
+                        help="run multiple workers without auto-reload")
+    parser.add_argument("--host", default=os.getenv("HOST", "0.0.0.0"))
+    parser.add_argument("--port", type=int, default=int(os.getenv("PORT", "8000")))
+    parser.add_argument("--workers", type=int,
+                        default=int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1)),
+                        help="worker processes in production mode (default: number of cores)")
+    parser.add_argument("--keep-alive", type=int, default=int(os.getenv("KEEP_ALIVE", "5")),
+                        help="seconds to keep idle connections open")
+    parser.add_argument("--backlog", type=int, default=int(os.getenv("BACKLOG", "2048")),
+                        help="maximum number of pending connections")
+    parser.add_argument("--graceful-timeout", type=int, default=int(os.getenv("GRACEFUL_TIMEOUT", "30")),
+                        help="seconds workers get to finish in-flight requests on restart/shutdown")
+    return parser.parse_args()
+
+def run_development(args):
+    """Single process with the file watcher, for local development"""
     uvicorn.run(
-        "app.main:app",
-        host="0.0.0.0",
-        port=8000,
+        APP,
+        host=args.host,
+        port=args.port,
         reload=True,
         log_level="info"
-    ) 
\ No newline at end of file
+    )
+
+def run_production(args):
+    """Multiple worker processes, no reload"""
+    try:
+        from gunicorn.app.base import BaseApplication
+    except ImportError:
+        # Gunicorn is not available on Windows; uvicorn's own process manager
+        # still gives one worker per core, without preloading
+        print("⚠️  Gunicorn not installed - using uvicorn workers (no preload, no graceful reload)")
+        uvicorn.run(
+            APP,
+            host=args.host,
+            port=args.port,
+            workers=args.workers,
+            backlog=args.backlog,
+            timeout_keep_alive=args.keep_alive,
+            timeout_graceful_shutdown=args.graceful_timeout,
+            log_level="info"
+        )
+        return
+
+    class ProductionServer(BaseApplication):
+        """Gunicorn master with uvicorn workers and the app preloaded before forking"""
+
+        def __init__(self, options):
+            self.options = options
+            super().__init__()
+
+        def load_config(self):
+            for key, value in self.options.items():
+                self.cfg.set(key, value)
+
+        def load(self):
+            from app.main import app
+            return app
+
+    # preload_app imports the app (and whatever read-only data it loads at
+    # import time) once in the master, so forked workers share those pages.
+    # Send SIGHUP to the master for a graceful restart of all workers.
+    ProductionServer({
+        "bind": f"{args.host}:{args.port}",
+        "workers": args.workers,
+        "worker_class": "uvicorn.workers.UvicornWorker",
+        "preload_app": True,
+        "keepalive": args.keep_alive,
+        "backlog": args.backlog,
+        "graceful_timeout": args.graceful_timeout,
+        "loglevel": "info"
+    }).run()
+
+if __name__ == "__main__":
+    args = parse_args()
+    print("🚀 Starting Workforce Distribution.ai Backend...")
+    print(f"📊 API will be available at: http://localhost:{args.port}")
+    print(f"📚 Documentation will be available at: http://localhost:{args.port}/docs")
+
+    if args.production:
+        print(f"🏭 Production mode: {args.workers} workers, keep-alive {args.keep_alive}s, backlog {args.backlog}")
+        run_production(args)
+    else:
+        run_development(args)
@@ -8,6 +8,9 @@ import os
 import sys
 import subprocess
 import socket
+import shutil
+import signal
+import time
 
 def check_port_available(port):
     """Check if a port is available"""
@@ -18,23 +21,56 @@ def check_port_available(port):
     except OSError:
         return False
 
+def find_pids_on_port(port):
+    """Find the PIDs of processes listening on the specified port"""
+    if sys.platform == "win32":
+        result = subprocess.run(["netstat", "-ano", "-p", "TCP"], capture_output=True, text=True)
+        ipv6 = subprocess.run(["netstat", "-ano", "-p", "TCPv6"], capture_output=True, text=True)
+        pids = set()
+        for line in (result.stdout + ipv6.stdout).splitlines():
+            # Proto, Local Address, Foreign Address, State, PID. Only the
+            # listener owns the port; ESTABLISHED/TIME_WAIT lines belong to
+            # clients (frontend, browsers) or to PID 0.
+            parts = line.split()
+            if (len(parts) == 5 and parts[3] == "LISTENING"
+                    and parts[1].endswith(f":{port}") and parts[4] != "0"):
+                pids.add(parts[4])
+        return pids
+
+    # Linux/macOS: lsof is the most widely available, fuser is the fallback
+    if shutil.which("lsof"):
+        result = subprocess.run(
+            ["lsof", "-t", f"-iTCP:{port}", "-sTCP:LISTEN"],
+            capture_output=True, text=True
+        )
+        return set(result.stdout.split())
+    if shutil.which("fuser"):
+        result = subprocess.run(["fuser", f"{port}/tcp"], capture_output=True, text=True)
+        return set(result.stdout.split())
+    return set()
+
 def kill_process_on_port(port):
     """Kill process using the specified port"""
     try:
-        result = subprocess.run(
-            f'netstat -ano | findstr :{port}',
-            shell=True, capture_output=True, text=True
-        )
-        if result.stdout:
-            lines = result.stdout.strip().split('\n')
-            for line in lines:
-                if f':{port}' in line:
-                    parts = line.split()
-                    if len(parts) >= 5:
-                        pid = parts[-1]
-                        print(f"🔄 Killing process {pid} on port {port}")
-                        subprocess.run(f'taskkill /PID {pid} /F', shell=True)
-                        return True
+        pids = find_pids_on_port(port)
+        for pid in pids:
+            print(f"🔄 Killing process {pid} on port {port}")
+            if sys.platform == "win32":
+                subprocess.run(f'taskkill /PID {pid} /F', shell=True)
+            else:
+                os.kill(int(pid), signal.SIGTERM)
+        if pids and sys.platform != "win32":
+            # Give the process a chance to shut down cleanly before forcing it
+            for _ in range(10):
+                if check_port_available(port):
+                    return True
+                time.sleep(0.5)
+            for pid in pids:
+                try:
+                    os.kill(int(pid), signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
+        return bool(pids)
     except Exception as e:
         print(f"⚠️  Could not kill process on port {port}: {e}")
     return False
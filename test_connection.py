@@ -7,13 +7,15 @@ import requests
 import time
 import sys
 
+from api_client import client
+
 def test_backend():
     """Test if backend is accessible"""
     print("🔍 Testing backend connection...")
     
     try:
         # Test health endpoint
-        response = requests.get("http://localhost:8000/api/v1/health", timeout=5)
+        response = client.get("/health", ttl=0, timeout=5)
         if response.status_code == 200:
             print("✅ Backend is running and accessible!")
             print(f"   Response: {response.json()}")
@@ -0,0 +1,20 @@
+import os
+import shutil
+import sqlite3
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# The scripts live at the repository root
+sys.path.insert(0, ROOT)
+
+@pytest.fixture
+def database(tmp_path):
+    """A throwaway copy of the shipped SQLite database"""
+    path = tmp_path / "workforce_ai.db"
+    shutil.copyfile(os.path.join(ROOT, "workforce_ai.db"), path)
+    connection = sqlite3.connect(path)
+    yield connection
+    connection.close()
@@ -0,0 +1,107 @@
+import threading
+
+import requests
+
+from api_client import APIClient
+
+class FakeResponse:
+    def __init__(self, status_code, url, etag=None):
+        self.status_code = status_code
+        self.url = url
+        self.headers = {"ETag": etag} if etag else {}
+
+class FakeSession:
+    """Records every GET and answers from a queue of status codes (200 by default)"""
+
+    def __init__(self):
+        self.headers = {}
+        self.cookies = requests.cookies.RequestsCookieJar()
+        self.calls = []
+        self.statuses = []
+        self.etag = None
+        self.during_get = None
+
+    def get(self, url, params=None, headers=None, **kwargs):
+        prepared = requests.PreparedRequest()
+        prepared.prepare_url(url, params)
+        self.calls.append((prepared.url, dict(headers or {})))
+        if self.during_get:
+            self.during_get()
+        return FakeResponse(self.statuses.pop(0) if self.statuses else 200, prepared.url, self.etag)
+
+    def request(self, method, url, **kwargs):
+        return FakeResponse(200, url)
+
+def make_client(**kwargs):
+    client = APIClient(base_url="http://api", **kwargs)
+    client.session = FakeSession()
+    return client
+
+def test_list_params_are_part_of_the_key():
+    client = make_client()
+    first = client.get("/jobs/", params={"department": ["Sales", "R&D"], "limit": 10})
+    assert client.get("/jobs/", params={"limit": 10, "department": ["Sales", "R&D"]}) is first
+    assert client.get("/jobs/", params={"department": ["Sales"], "limit": 10}) is not first
+    assert [url for url, _ in client.session.calls] == [
+        "http://api/jobs/?department=Sales&department=R%26D&limit=10",
+        "http://api/jobs/?department=Sales&limit=10"
+    ]
+
+def test_least_recently_used_entry_is_evicted():
+    client = make_client(cache_size=2)
+    client.get("/a")
+    client.get("/b")
+    client.get("/a")
+    client.get("/c")
+    assert client.stats["evicted"] == 1
+    client.get("/a")
+    client.get("/b")
+    assert [url for url, _ in client.session.calls] == ["http://api/a", "http://api/b", "http://api/c", "http://api/b"]
+
+def test_stale_entry_is_revalidated_with_etag():
+    client = make_client(default_ttl=30)
+    client.session.etag = '"v1"'
+    first = client.get("/stats")
+    client._cache[next(iter(client._cache))]["fetched_at"] -= 60
+    client.session.statuses = [304]
+    assert client.get("/stats") is first
+    assert client.session.calls[-1][1] == {"If-None-Match": '"v1"'}
+    assert client.stats["revalidated"] == 1
+    # The 304 made the entry fresh again
+    assert client.get("/stats") is first
+    assert len(client.session.calls) == 2
+
+def test_get_racing_a_write_is_not_cached():
+    client = make_client()
+    client.session.during_get = lambda: client.post("/jobs/")
+    client.get("/jobs/")
+    client.session.during_get = None
+    client.get("/jobs/")
+    assert len(client.session.calls) == 2
+
+def test_requests_with_credentials_are_not_cached():
+    client = make_client()
+    client.get("/candidates/", headers={"Authorization": "Bearer alice"})
+    client.get("/candidates/", headers={"Authorization": "Bearer bob"})
+    client.session.headers["Authorization"] = "Bearer alice"
+    client.get("/candidates/")
+    client.get("/candidates/")
+    assert len(client.session.calls) == 4
+    assert not client._cache
+
+def test_per_call_headers_are_part_of_the_key():
+    client = make_client()
+    client.get("/jobs/", headers={"Accept": "text/csv"})
+    client.get("/jobs/")
+    client.get("/jobs/", headers={"accept": "text/csv"})
+    assert len(client.session.calls) == 2
+
+def test_concurrent_gets_share_the_cache():
+    client = make_client()
+    client.get("/jobs/")
+    threads = [threading.Thread(target=client.get, args=("/jobs/",)) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert client.stats["hits"] == 8
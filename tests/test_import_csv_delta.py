@@ -0,0 +1,210 @@
+import csv
+
+import pytest
+
+import import_csv_data
+
+HEADER = ["Age", "Attrition", "Department", "Education", "EmployeeNumber", "JobRole",
+          "MonthlyIncome", "TotalWorkingYears"]
+
+def employee(number, age=30, attrition="No", income=5000, years=5):
+    return [str(age), attrition, "Sales", "3", str(number), "Sales Executive", str(income), str(years)]
+
+class FakeResponse:
+    def __init__(self, status_code, payload):
+        self.status_code = status_code
+        self.payload = payload
+        self.text = str(payload)
+
+    def json(self):
+        return self.payload
+
+class FakeClient:
+    """Stands in for the backend: the import endpoint rejects duplicates like
+    ix_candidates_email and, like the real import, only creates candidates for
+    employees who have not left"""
+
+    def __init__(self):
+        self.imported = []
+        self.candidates = {}
+        self.updates = []
+        self.failing = set()
+
+    def post(self, path, params=None, **kwargs):
+        with open(params["file_path"], newline='', encoding='utf-8') as f:
+            rows = list(csv.DictReader(f))
+        numbers = [row["EmployeeNumber"] for row in rows]
+        if set(numbers) & self.failing:
+            return FakeResponse(500, {"detail": "database is locked"})
+        if len(set(numbers)) != len(numbers) or set(numbers) & set(self.imported):
+            return FakeResponse(500, {"detail": "UNIQUE constraint failed: candidates.email"})
+        self.imported.extend(numbers)
+        for row in rows:
+            if row["Attrition"] == "No":
+                candidate_id = len(self.candidates) + 1
+                self.candidates[candidate_id] = {
+                    "id": candidate_id, "email": f"employee{row['EmployeeNumber']}@company.com",
+                    "is_available": True
+                }
+        return FakeResponse(200, {"jobs_created": 0, "candidates_created": len(rows), "skills_created": 0})
+
+    def get(self, path, params=None, **kwargs):
+        assert path == "/candidates/"
+        candidates = list(self.candidates.values())
+        page = candidates[params["skip"]:params["skip"] + params["limit"]]
+        return FakeResponse(200, {"total": len(candidates), "candidates": page})
+
+    def put(self, path, json=None, **kwargs):
+        candidate_id = int(path.rstrip("/").rsplit("/", 1)[1])
+        if candidate_id not in self.candidates:
+            return FakeResponse(404, {"detail": "Candidate not found"})
+        self.candidates[candidate_id].update(json)
+        self.updates.append((candidate_id, json))
+        return FakeResponse(200, self.candidates[candidate_id])
+
+    def candidate(self, number):
+        return next(c for c in self.candidates.values() if c["email"] == f"employee{number}@company.com")
+
+@pytest.fixture
+def api(tmp_path, monkeypatch):
+    chunk_dir = tmp_path / ".import_chunks"
+    monkeypatch.setattr(import_csv_data, "CHUNK_DIR", str(chunk_dir))
+    monkeypatch.setattr(import_csv_data, "EMPLOYEE_STATE_DB", str(chunk_dir / "employee_state.db"))
+    monkeypatch.setattr(import_csv_data, "DELTA_CHANGES_FILE", str(chunk_dir / "delta_changes.csv"))
+    monkeypatch.setattr(import_csv_data, "MULTI_FILE_MANIFEST", str(chunk_dir / "multi_file_manifest.json"))
+    fake = FakeClient()
+    monkeypatch.setattr(import_csv_data, "client", fake)
+    return fake
+
+@pytest.fixture
+def extract(tmp_path):
+    def write(rows, name="extract.csv"):
+        path = tmp_path / name
+        with open(path, "w", newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(HEADER)
+            writer.writerows(rows)
+        return str(path)
+    return write
+
+def known(header, rows):
+    """State store entries for rows as if they had been imported"""
+    key = header.index("EmployeeNumber")
+    attrition = header.index("Attrition")
+    return {row[key]: (import_csv_data.row_fingerprint(row), row[attrition], None, None, None) for row in rows}
+
+def reported_changes():
+    with open(import_csv_data.DELTA_CHANGES_FILE, newline='', encoding='utf-8') as f:
+        return [row["EmployeeNumber"] for row in csv.DictReader(f)]
+
+def test_classify_rows():
+    imported = [employee(1), employee(2), employee(3)]
+    current = [employee(1), employee(2, age=41), employee(3, attrition="Yes"), employee(4)]
+    result = import_csv_data.classify_rows(HEADER, current, known(HEADER, imported))
+    assert result["unchanged"] == 1
+    assert [row[4] for row in result["changed"]] == ["2", "3"]
+    assert result["flipped"] == ["3"]
+    assert [row[4] for row in result["new"]] == ["4"]
+    assert result["already_reported"] == 0
+
+def test_classify_rows_skips_reported_changes():
+    changed = employee(3, attrition="Yes")
+    state = known(HEADER, [employee(3)])
+    state["3"] = state["3"][:2] + (import_csv_data.row_fingerprint(changed), "Yes", None)
+    result = import_csv_data.classify_rows(HEADER, [changed], state)
+    assert result["changed"] == [] and result["flipped"] == []
+    assert result["already_reported"] == 1
+
+    # A further change is returned again, but the flip is not
+    changed_again = employee(3, age=31, attrition="Yes")
+    result = import_csv_data.classify_rows(HEADER, [changed_again], state)
+    assert result["changed"] == [changed_again]
+    assert result["flipped"] == []
+
+def test_candidate_fields():
+    fields = import_csv_data.candidate_fields(HEADER, employee(7, attrition="Yes", income=5130, years=10))
+    assert fields == {
+        "last_name": "FromSales", "years_experience": 10.0, "expected_salary": 61560.0,
+        "preferred_departments": ["Sales"], "current_position": "Sales Representative",
+        "education_level": "Bachelor", "is_available": False
+    }
+    assert "is_available" not in import_csv_data.candidate_fields(HEADER, employee(7))
+
+def test_delta_import_updates_changed_candidates(api, extract):
+    result = import_csv_data.import_csv_delta(extract([employee(1), employee(2), employee(3)]), chunk_size=2)
+    assert result["total_records"] == 3
+    assert sorted(api.imported) == ["1", "2", "3"]
+
+    path = extract([employee(1), employee(2, income=6000), employee(3, attrition="Yes"), employee(4)])
+    result = import_csv_data.import_csv_delta(path, chunk_size=2)
+    assert result["total_records"] == 1
+    assert result["unchanged"] == 1
+    assert result["updated"] == 2 and result["failed"] == 0
+    assert result["attrition_flipped"] == result["marked_unavailable"] == ["3"]
+    assert api.candidate(2)["expected_salary"] == 72000.0
+    assert api.candidate(2)["is_available"] is True
+    assert api.candidate(3)["is_available"] is False
+    assert not import_csv_data.os.path.exists(import_csv_data.DELTA_CHANGES_FILE)
+
+    # Applied changes are the new baseline
+    result = import_csv_data.import_csv_delta(path, chunk_size=2)
+    assert result["total_records"] == 0
+    assert result["changed"] == 0 and result["unchanged"] == 4
+    assert len(api.updates) == 2
+
+def test_delta_import_reports_unapplied_changes_once(api, extract):
+    # Employee 2 had already left when first imported, so has no candidate
+    import_csv_data.import_csv_delta(extract([employee(1), employee(2, attrition="Yes")]))
+    path = extract([employee(1, age=31), employee(2, age=41, attrition="Yes")])
+
+    result = import_csv_data.import_csv_delta(path)
+    assert result["updated"] == 1 and result["failed"] == 1
+    assert reported_changes() == ["2"]
+
+    result = import_csv_data.import_csv_delta(path)
+    assert result["changed"] == 0 and result["already_reported"] == 1
+    assert reported_changes() == ["2"]
+
+def test_delta_import_keeps_last_row_for_duplicate_employees(api, extract):
+    path = extract([employee(1), employee(2), employee(1, age=31)])
+    result = import_csv_data.import_csv_delta(path)
+    assert result is not None
+    assert result["total_records"] == 2
+    assert result["duplicates"] == 1
+    assert sorted(api.imported) == ["1", "2"]
+
+    # The recorded row is the last one, so a re-run sees nothing new or changed
+    result = import_csv_data.import_csv_delta(path)
+    assert result["total_records"] == 0
+    assert result["unchanged"] == 2
+    assert result["changed"] == 0
+
+def test_import_succeeds_when_recording_state_fails(api, extract, monkeypatch):
+    monkeypatch.setattr(import_csv_data, "CSV_FILE_PATH", extract([employee(1)]))
+
+    def fail(header, rows):
+        raise OSError("disk full")
+    monkeypatch.setattr(import_csv_data, "record_employees", fail)
+    api.post = lambda path, params=None, **kwargs: FakeResponse(
+        200, {"jobs_created": 1, "candidates_created": 1, "skills_created": 0, "total_records": 1})
+    assert import_csv_data.import_csv_data()["total_records"] == 1
+
+def test_multi_file_import_stops_after_a_failed_file(api, extract, capsys):
+    files = [
+        extract([employee(1), employee(2), employee(3), employee(4)], "a.csv"),
+        extract([employee(3, age=50), employee(5)], "b.csv")
+    ]
+    api.failing = {"4"}
+    assert import_csv_data.import_csv_files(files, chunk_size=2) is None
+    # b.csv would otherwise win employee 3 while a.csv is retried
+    assert sorted(api.imported) == ["1", "2"]
+    output = capsys.readouterr().out
+    assert "b.csv: skipped (an earlier file failed)" in output
+
+    api.failing = set()
+    result = import_csv_data.import_csv_files(files, chunk_size=2)
+    assert result["total_records"] == 3
+    assert sorted(api.imported) == ["1", "2", "3", "4", "5"]
+    output = capsys.readouterr().out
+    assert "a.csv: imported - 2 rows, 2 rows imported by a previous run, 0 duplicate employees skipped" in output
+    assert "b.csv: imported - 1 rows, 1 duplicate employees skipped" in output
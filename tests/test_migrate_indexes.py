@@ -0,0 +1,25 @@
+import migrate_indexes
+
+def index_names(connection):
+    return {row[0] for row in connection.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+
+def test_unmigrated_database_has_full_scans(database):
+    assert migrate_indexes.check_query_plans(database)
+
+def test_migrate_creates_indexes(database):
+    migrate_indexes.migrate(database)
+    assert set(migrate_indexes.INDEXES) <= index_names(database)
+
+def test_queries_use_indexes_after_migration(database):
+    migrate_indexes.migrate(database)
+    assert migrate_indexes.check_query_plans(database) == {}
+
+def test_query_plans_ignore_analyze_statistics(database):
+    migrate_indexes.migrate(database)
+    database.execute("ANALYZE")
+    assert migrate_indexes.check_query_plans(database) == {}
+
+def test_migrate_is_idempotent(database):
+    migrate_indexes.migrate(database)
+    migrate_indexes.migrate(database)
+    assert migrate_indexes.check_query_plans(database) == {}
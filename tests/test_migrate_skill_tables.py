@@ -0,0 +1,78 @@
+import json
+
+import migrate_skill_tables
+
+def count(connection, table):
+    return connection.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+def insert_candidate(connection, **overrides):
+    """Insert a copy of the first candidate with the given columns replaced"""
+    columns = [row[1] for row in connection.execute("PRAGMA table_info(candidates)") if row[1] != "id"]
+    row = dict(zip(columns, connection.execute(f"SELECT {', '.join(columns)} FROM candidates LIMIT 1").fetchone()))
+    row.update(overrides)
+    cursor = connection.execute(
+        f"INSERT INTO candidates ({', '.join(row)}) VALUES ({', '.join('?' * len(row))})", list(row.values())
+    )
+    return cursor.lastrowid
+
+def mapped_skills(connection, candidate_id):
+    return dict(connection.execute(
+        "SELECT s.name, cs.level FROM candidate_skills cs JOIN skills s ON s.id = cs.skill_id "
+        "WHERE cs.candidate_id = ?", (candidate_id,)
+    ))
+
+def expected_candidate_rows(connection):
+    """Numeric skill levels whose name is in the skills catalog"""
+    names = {row[0] for row in connection.execute("SELECT name FROM skills")}
+    total = 0
+    for (skills,) in connection.execute("SELECT skills FROM candidates"):
+        total += sum(1 for name, level in json.loads(skills or "{}").items()
+                     if name in names and isinstance(level, (int, float)))
+    return total
+
+def test_backfill_row_counts(database):
+    candidate_rows, job_rows, unmapped = migrate_skill_tables.migrate(database)
+    assert candidate_rows == count(database, "candidate_skills") == expected_candidate_rows(database)
+    assert job_rows == count(database, "job_skills") > 0
+    assert set(unmapped) == {"Experience", "Problem Solving", "Strategic Thinking"}
+
+def test_migration_can_be_rerun(database):
+    first = migrate_skill_tables.migrate(database)
+    assert migrate_skill_tables.migrate(database) == first
+    triggers = database.execute("SELECT COUNT(*) FROM sqlite_master WHERE type = 'trigger'").fetchone()[0]
+    assert triggers == len(migrate_skill_tables.TRIGGER_NAMES)
+
+def test_migration_does_not_write_to_skills(database):
+    before = database.execute("SELECT * FROM skills ORDER BY id").fetchall()
+    migrate_skill_tables.migrate(database)
+    candidate_id = insert_candidate(database, email="new.skill@example.com",
+                                    skills=json.dumps({"Zig": 8, "Python": 7}))
+    assert database.execute("SELECT * FROM skills ORDER BY id").fetchall() == before
+    assert mapped_skills(database, candidate_id) == {"Python": 7}
+
+def test_insert_with_bad_skill_data_succeeds(database):
+    migrate_skill_tables.migrate(database)
+    null_scores = insert_candidate(database, email="null.scores@example.com",
+                                   skills=json.dumps({"Python": 7}), skill_scores=None)
+    bad_scores = insert_candidate(database, email="bad.scores@example.com",
+                                  skills=json.dumps({"Python": 6}), skill_scores="not json")
+    bad_level = insert_candidate(database, email="bad.level@example.com",
+                                 skills=json.dumps({"Python": "expert", "Statistics": None, "Research": 5}))
+    bad_skills = insert_candidate(database, email="bad.skills@example.com", skills="not json")
+
+    assert mapped_skills(database, null_scores) == {"Python": 7}
+    assert mapped_skills(database, bad_scores) == {"Python": 6}
+    assert mapped_skills(database, bad_level) == {"Research": 5}
+    assert mapped_skills(database, bad_skills) == {}
+
+def test_new_skill_maps_existing_candidates(database):
+    migrate_skill_tables.migrate(database)
+    candidate_id = insert_candidate(database, email="zig@example.com", skills=json.dumps({"Zig": 8}))
+    assert mapped_skills(database, candidate_id) == {}
+
+    database.execute("INSERT INTO skills (name, category, description, is_active) "
+                     "VALUES ('Zig', 'Programming', 'Zig', 1)")
+    assert mapped_skills(database, candidate_id) == {"Zig": 8}
+
+    database.execute("DELETE FROM skills WHERE name = 'Zig'")
+    assert mapped_skills(database, candidate_id) == {}
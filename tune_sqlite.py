@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+SQLite performance profile for the default sqlite:///./workforce_ai.db deployment
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
+
+DEFAULT_DATABASE_URL = "sqlite:///./workforce_ai.db"
+
+BUSY_TIMEOUT_SECONDS = 30
+
+# Applied on every connection. journal_mode=WAL is persistent in the database
+# file; the others are per-connection and must be set each time.
+TUNED_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "cache_size": -64000,       # 64 MB page cache (negative = KiB)
+    "mmap_size": 268435456,     # 256 MB memory-mapped I/O
+    "temp_store": "MEMORY",
+    "busy_timeout": BUSY_TIMEOUT_SECONDS * 1000
+}
+
+# Read-only connections cannot change the journal mode
+READ_ONLY_PRAGMAS = {k: v for k, v in TUNED_PRAGMAS.items() if k != "journal_mode"}
+
+def database_path(database_url):
+    """Resolve the SQLite file path from a DATABASE_URL"""
+    prefix = "sqlite:///"
+    if not database_url.startswith(prefix):
+        raise ValueError(f"Only SQLite databases are supported, got: {database_url}")
+    return database_url[len(prefix):]
+
+def connect(path, read_only=False):
+    """Open a connection with the tuned profile applied"""
+    if read_only:
+        connection = sqlite3.connect(f"file:{os.path.abspath(path)}?mode=ro", uri=True,
+                                     timeout=BUSY_TIMEOUT_SECONDS, check_same_thread=False)
+        pragmas = READ_ONLY_PRAGMAS
+    else:
+        connection = sqlite3.connect(path, timeout=BUSY_TIMEOUT_SECONDS, check_same_thread=False)
+        pragmas = TUNED_PRAGMAS
+    for name, value in pragmas.items():
+        connection.execute(f"PRAGMA {name} = {value}")
+    return connection
+
+class ConnectionPool:
+    """Per-thread connection reuse with separate writer and read-only connections
+
+    In WAL mode readers see the last committed snapshot and never wait for a
+    writer, so dashboard reads keep flowing while an import transaction is open.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+        self._connections = []
+        self._lock = threading.Lock()
+
+    def _get(self, attr, read_only):
+        connection = getattr(self._local, attr, None)
+        if connection is None:
+            connection = connect(self.path, read_only=read_only)
+            setattr(self._local, attr, connection)
+            with self._lock:
+                self._connections.append(connection)
+        return connection
+
+    def writer(self):
+        """Connection for writes, reused by the calling thread"""
+        return self._get("writer", read_only=False)
+
+    def reader(self):
+        """Read-only connection, reused by the calling thread"""
+        return self._get("reader", read_only=True)
+
+    def close(self):
+        """Close every connection handed out by the pool"""
+        with self._lock:
+            for connection in self._connections:
+                connection.close()
+            self._connections.clear()
+
+def set_journal_mode(path, mode):
+    """Switch the database file's journal mode (persists across connections)"""
+    connection = sqlite3.connect(path, timeout=BUSY_TIMEOUT_SECONDS)
+    try:
+        return connection.execute(f"PRAGMA journal_mode = {mode}").fetchone()[0]
+    finally:
+        connection.close()
+
+def enable_wal(path):
+    """Switch the database file to WAL journaling"""
+    return set_journal_mode(path, "WAL")
+
+# Queries the dashboard stats issue on every page load
+DASHBOARD_QUERIES = [
+    "SELECT COUNT(*) FROM jobs",
+    "SELECT COUNT(*) FROM jobs WHERE is_active = 1",
+    "SELECT COUNT(*) FROM candidates",
+    "SELECT COUNT(*) FROM candidates WHERE is_available = 1",
+    "SELECT AVG(years_experience) FROM candidates"
+]
+
+CANDIDATE_COLUMNS = [
+    "first_name", "last_name", "email", "phone", "current_position", "current_company",
+    "years_experience", "education_level", "skills", "skill_scores", "overall_score",
+    "expected_salary", "salary_currency", "preferred_locations", "preferred_work_type",
+    "preferred_departments", "is_available", "status"
+]
+
+def run_import_and_reads(path, tuned, batches, batch_size, readers):
+    """Bulk-insert candidates while reader threads run dashboard queries"""
+    if tuned:
+        pool = ConnectionPool(path)
+        open_writer, open_reader = pool.writer, pool.reader
+    else:
+        # Stock sqlite3 settings: rollback journal, FULL sync, 5s timeout
+        open_writer = open_reader = lambda: sqlite3.connect(path)
+
+    template = open_writer().execute(
+        f"SELECT {', '.join(CANDIDATE_COLUMNS)} FROM candidates LIMIT 1"
+    ).fetchone()
+    email_index = CANDIDATE_COLUMNS.index("email")
+    insert_sql = (f"INSERT INTO candidates ({', '.join(CANDIDATE_COLUMNS)}) "
+                  f"VALUES ({', '.join('?' * len(CANDIDATE_COLUMNS))})")
+
+    done = threading.Event()
+    read_latencies = [[] for _ in range(readers)]
+    read_errors = [0] * readers
+
+    def reader(slot):
+        connection = open_reader()
+        while not done.is_set():
+            started = time.perf_counter()
+            try:
+                for query in DASHBOARD_QUERIES:
+                    connection.execute(query).fetchone()
+                read_latencies[slot].append(time.perf_counter() - started)
+            except sqlite3.OperationalError:
+                read_errors[slot] += 1
+
+    def writer():
+        connection = open_writer()
+        for batch in range(batches):
+            rows = []
+            for i in range(batch_size):
+                row = list(template)
+                row[email_index] = f"bench{batch}_{i}@example.com"
+                rows.append(row)
+            with connection:
+                connection.executemany(insert_sql, rows)
+
+    threads = [threading.Thread(target=reader, args=(slot,)) for slot in range(readers)]
+    for thread in threads:
+        thread.start()
+    started = time.perf_counter()
+    writer()
+    elapsed = time.perf_counter() - started
+    done.set()
+    for thread in threads:
+        thread.join()
+    if tuned:
+        pool.close()
+
+    latencies = sorted(latency for slot in read_latencies for latency in slot)
+    p99 = latencies[int(len(latencies) * 0.99)] if latencies else 0.0
+    return {
+        "mode": "tuned" if tuned else "default",
+        "import_seconds": round(elapsed, 3),
+        "rows_inserted": batches * batch_size,
+        "dashboard_reads": len(latencies),
+        "dashboard_reads_per_second": round(len(latencies) / elapsed, 1),
+        "read_p99_ms": round(p99 * 1000, 2),
+        "read_max_ms": round(latencies[-1] * 1000, 2) if latencies else 0.0,
+        "read_errors": sum(read_errors)
+    }
+
+def benchmark(path, batches=50, batch_size=1000, readers=4):
+    """Compare concurrent read throughput during a bulk import, default vs tuned"""
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for tuned in (False, True):
+            copy = os.path.join(tmp, f"bench_{'tuned' if tuned else 'default'}.db")
+            shutil.copyfile(path, copy)
+            # The copy keeps the source's journal mode, which is already WAL
+            # once this script has been run, so the baseline is reset
+            set_journal_mode(copy, "WAL" if tuned else "DELETE")
+            results.append(run_import_and_reads(copy, tuned, batches, batch_size, readers))
+    return results
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Apply the SQLite performance profile")
+    parser.add_argument("--database-url", default=os.getenv("DATABASE_URL", DEFAULT_DATABASE_URL),
+                        help="SQLite DATABASE_URL (defaults to the DATABASE_URL environment variable)")
+    parser.add_argument("--benchmark", action="store_true",
+                        help="measure dashboard read throughput during a bulk import on copies of the database")
+    parser.add_argument("--batches", type=int, default=50)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--readers", type=int, default=4)
+    args = parser.parse_args()
+
+    print("🔧 SQLite Performance Profile")
+    print("=" * 40)
+
+    path = database_path(args.database_url)
+    if not os.path.exists(path):
+        print(f"❌ Database not found: {path}")
+        return False
+
+    if args.benchmark:
+        print(f"⏱️  Importing {args.batches * args.batch_size} rows with {args.readers} concurrent readers...")
+        results = benchmark(path, args.batches, args.batch_size, args.readers)
+        for result in results:
+            print(f"   {result['mode']:>7}: import {result['import_seconds']}s, "
+                  f"{result['dashboard_reads_per_second']} dashboard reads/sec, "
+                  f"p99 {result['read_p99_ms']}ms, "
+                  f"{result['read_errors']} read errors")
+        print(json.dumps(results, indent=2))
+        return True
+
+    mode = enable_wal(path)
+    if mode.lower() != "wal":
+        print(f"❌ Could not enable WAL (journal mode is {mode})")
+        return False
+    print(f"✅ {path} now uses WAL journaling")
+    print("\n📋 Per-connection settings to apply in the database engine:")
+    for name, value in READ_ONLY_PRAGMAS.items():
+        print(f"   PRAGMA {name} = {value}")
+    return True
+
+if __name__ == "__main__":
+    main()